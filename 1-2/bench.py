@@ -0,0 +1,237 @@
+"""
+bench.py - QuizGame의 불러오기/저장/풀기/목록/점수 확인 성능 측정
+
+[측정 방법]
+- 1천 ~ 100만 개 크기의 가짜 퀴즈 은행(state 파일)을 임시 폴더에 만듭니다.
+  game_history도 퀴즈 수와 같은 개수로 채웁니다.
+- input() 대신 미리 정해 둔 답(ScriptedInput)을 넣어 사람 없이 실행합니다.
+- 화면 출력은 버리고, 출력된 바이트 수만 셉니다.
+- 작업마다 다음을 기록합니다.
+    wall_ms      : 걸린 시간 (tracemalloc 없이 따로 측정)
+    peak_bytes   : tracemalloc으로 잰 최대 메모리 사용량
+    file_bytes   : 작업 후 state 파일 크기 (파일을 쓰는 작업만)
+    output_bytes : 화면에 출력한 바이트 수
+
+[실행 예시]
+    python bench.py                                 # 1천 ~ 100만 전체 (오래 걸림)
+    python bench.py --sizes 1000,10000 --out base.json
+    python bench.py --sizes 1000,10000 --compact --baseline base.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from game import QuizGame
+
+DEFAULT_SIZES = [1000, 10000, 100000, 1000000]
+DEFAULT_SEED = 2026
+OPERATIONS = ["load_state", "save_state", "play_quiz", "list_quizzes", "show_score"]
+
+
+class ScriptedInput:
+    # input() 대신 미리 정해 둔 답을 순서대로 돌려주는 함수 객체입니다.
+    def __init__(self, answers):
+        self.answers = answers
+        self.position = 0
+
+    def __call__(self, prompt=""):
+        answer = self.answers[self.position]
+        self.position = self.position + 1
+        return answer
+
+
+class CountingWriter(io.TextIOBase):
+    # 출력 내용을 버리고 UTF-8 바이트 수만 세는 가짜 stdout입니다.
+    def __init__(self):
+        self.byte_count = 0
+
+    def writable(self):
+        return True
+
+    def write(self, text):
+        self.byte_count = self.byte_count + len(text.encode("utf-8"))
+        return len(text)
+
+
+# ==============================================================
+# 가짜 퀴즈 은행 만들기
+# ==============================================================
+def generate_state(size, seed):
+    rng = random.Random(seed)
+    topics = ["리스트", "딕셔너리", "함수", "클래스", "반복문", "조건문", "예외", "파일", "문자열", "모듈"]
+
+    quizzes = []
+    for i in range(size):
+        topic = topics[rng.randrange(len(topics))]
+        quiz = {}
+        quiz["question"] = f"[{i + 1}] Python {topic}에 대한 설명으로 옳은 것은? ({rng.randrange(1000000)})"
+        quiz["choices"] = [f"{topic} 보기 {rng.randrange(100)}" for _ in range(4)]
+        quiz["answer"] = rng.randint(1, 4)
+        quiz["last_correct"] = rng.choice([None, True, False])
+        quizzes.append(quiz)
+
+    game_history = []
+    for i in range(size):
+        correct = rng.randint(0, size)
+        record = {}
+        record["date"] = f"2026-01-01 00:00:{i % 60:02d}"
+        record["correct"] = correct
+        record["total"] = size
+        record["score_percent"] = int(correct / size * 100)
+        game_history.append(record)
+
+    data = {}
+    data["quizzes"] = quizzes
+    data["best_score"] = size // 2
+    data["game_history"] = game_history
+    return data
+
+
+# 풀기용 답안: 퀴즈 수만큼 "1"~"4"를 정해 둡니다.
+def generate_answers(size, seed):
+    rng = random.Random(seed + 1)
+    return [str(rng.randint(1, 4)) for _ in range(size)]
+
+
+# ==============================================================
+# 한 작업 측정
+# ==============================================================
+def prepare_task(operation, state_file, compact, answers):
+    # load_state가 아니면 게임을 미리 불러 두고, 측정할 메서드만 돌려줍니다.
+    if operation == "load_state":
+        def task():
+            QuizGame(compact=compact, state_file=state_file)
+        return task
+
+    with contextlib.redirect_stdout(CountingWriter()):
+        game = QuizGame(compact=compact, state_file=state_file,
+                        input_func=ScriptedInput(answers))
+    return getattr(game, operation)
+
+
+def measure(operation, state_file, compact, answers, with_memory):
+    # 1) 시간 측정 (tracemalloc은 실행을 느리게 하므로 끈 상태로 잽니다)
+    task = prepare_task(operation, state_file, compact, answers)
+    output = CountingWriter()
+    with contextlib.redirect_stdout(output):
+        start = time.perf_counter()
+        task()
+        wall_ms = (time.perf_counter() - start) * 1000
+    del task
+
+    result = {}
+    result["operation"] = operation
+    result["wall_ms"] = round(wall_ms, 3)
+    result["output_bytes"] = output.byte_count
+    if operation in ("save_state", "play_quiz"):
+        result["file_bytes"] = os.path.getsize(state_file)
+    else:
+        result["file_bytes"] = 0
+
+    # 2) 메모리 측정 (같은 작업을 tracemalloc을 켠 상태로 한 번 더 실행)
+    result["peak_bytes"] = None
+    if with_memory:
+        task = prepare_task(operation, state_file, compact, answers)
+        tracemalloc.start()
+        with contextlib.redirect_stdout(CountingWriter()):
+            task()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        result["peak_bytes"] = peak
+    return result
+
+
+def run_benchmark(sizes, seed, compact, with_memory, work_dir):
+    results = []
+    for size in sizes:
+        state_file = os.path.join(work_dir, f"state_{size}.json")
+        data = generate_state(size, seed)
+        f = open(state_file, "w", encoding="utf-8")
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.close()
+        del data
+        answers = generate_answers(size, seed)
+
+        for operation in OPERATIONS:
+            result = measure(operation, state_file, compact, answers, with_memory)
+            result["size"] = size
+            results.append(result)
+            print(f"  {size:>8} {operation:<13} {result['wall_ms']:>12.1f} ms", file=sys.stderr)
+
+        os.remove(state_file)
+    return results
+
+
+# ==============================================================
+# 기준(baseline) 결과와 비교
+# ==============================================================
+def compare_with_baseline(results, baseline):
+    base_map = {}
+    for base in baseline["results"]:
+        base_map[(base["size"], base["operation"])] = base
+
+    print(f"\n{'크기':>8} {'작업':<13} {'시간 비율':>10} {'메모리 비율':>12} {'파일 비율':>10}", file=sys.stderr)
+    for result in results:
+        base = base_map.get((result["size"], result["operation"]))
+        if base is None:
+            continue
+        columns = []
+        for key in ("wall_ms", "peak_bytes", "file_bytes"):
+            if result[key] and base.get(key):
+                columns.append(f"{result[key] / base[key]:.2f}x")
+            else:
+                columns.append("-")
+        print(f"{result['size']:>8} {result['operation']:<13} {columns[0]:>10} {columns[1]:>12} {columns[2]:>10}",
+              file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="QuizGame 성능 측정")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+                        help="쉼표로 구분한 퀴즈 수 목록 (기본: 1000,10000,100000,1000000)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="가짜 데이터 생성 시드")
+    parser.add_argument("--compact", action="store_true", help="QuizStore(compact 모드)로 측정")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc 메모리 측정 생략")
+    parser.add_argument("--out", default=None, help="결과 JSON을 저장할 파일 (없으면 화면 출력)")
+    parser.add_argument("--baseline", default=None, help="비교할 기준 결과 JSON 파일")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    with tempfile.TemporaryDirectory() as work_dir:
+        results = run_benchmark(sizes, args.seed, args.compact, not args.no_memory, work_dir)
+
+    report = {}
+    report["meta"] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "compact": args.compact,
+        "sizes": sizes,
+    }
+    report["results"] = results
+
+    if args.out is None:
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        f = open(args.out, "w", encoding="utf-8")
+        json.dump(report, f, ensure_ascii=False, indent=2)
+        f.close()
+
+    if args.baseline is not None:
+        f = open(args.baseline, "r", encoding="utf-8")
+        baseline = json.load(f)
+        f.close()
+        compare_with_baseline(results, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,19 +12,43 @@ import json
 import os
 
 from quiz import Quiz, DEFAULT_QUIZZES
+from search import QuizIndex
+from store import QuizStore, QuizStoreError
 
 # state.json 파일이 저장될 경로입니다. (game.py와 같은 폴더)
 STATE_FILE = os.path.join(os.path.dirname(__file__), "state.json")
 
 
+# state.json을 안전하게 씁니다.
+# 임시 파일에 먼저 쓴 뒤 os.replace로 바꿔치기하므로,
+# 쓰는 도중 프로그램이 멈춰도 기존 파일이 반쯤 지워진 채로 남지 않습니다.
+def write_state_file(data, path=None):
+    if path is None:
+        path = STATE_FILE
+    temp_file = path + ".tmp"
+    f = open(temp_file, "w", encoding="utf-8")
+    json.dump(data, f, ensure_ascii=False, indent=2)
+    f.close()
+    os.replace(temp_file, path)
+
+
 class QuizGame:
     # ==============================================================
     # 프로그램 시작 시 변수 초기화
     # ==============================================================
-    def __init__(self):
-        self.quizzes = []       # 퀴즈 목록을 담는 리스트
+    # compact=True이면 퀴즈를 QuizStore(열 단위 저장소)에 담아 메모리를 아낍니다.
+    # state_file과 input_func를 바꾸면 다른 파일/스크립트 입력으로 실행할 수 있습니다. (벤치마크용)
+    def __init__(self, compact=False, state_file=None, input_func=input):
+        self.compact = compact
+        if state_file is None:
+            state_file = STATE_FILE
+        self.state_file = state_file  # 데이터를 저장할 파일 경로
+        self.input_func = input_func  # 사용자 입력을 받는 함수
+        self.quizzes = self.new_quiz_list()  # 퀴즈 목록 (list 또는 QuizStore)
         self.best_score = 0     # 역대 최고 점수 (맞힌 문제 수)
         self.game_history = []  # 시행별 게임 기록 리스트
+        self.user_histories = {}  # 서버 모드의 플레이어별 게임 기록 {이름: [기록, ...]}
+        self.search_index = None  # 검색용 색인 (처음 필요할 때 만듭니다)
 
         # 프로그램 시작 시 저장된 데이터를 파일에서 불러옵니다.
         self.load_state()
@@ -33,8 +57,12 @@ class QuizGame:
     # 1. 파일 불러오기 (state.json → 프로그램 변수)
     # ==============================================================
     def load_state(self):
+        # 퀴즈 목록이 바뀌므로 검색 색인은 다음에 필요할 때 다시 만듭니다.
+        self.search_index = None
+
         # 저장 파일이 없으면 기본 퀴즈 5개로 시작합니다.
-        if not os.path.exists(STATE_FILE):
+        if not os.path.exists(self.state_file):
+            self.quizzes = self.new_quiz_list()
             for quiz in DEFAULT_QUIZZES:
                 self.quizzes.append(quiz)
             return
@@ -42,25 +70,31 @@ class QuizGame:
         # 파일이 있으면 읽어서 데이터를 복원합니다.
         # try/except: 파일이 손상되거나 형식이 잘못되었을 때 오류 없이 처리합니다.
         try:
-            f = open(STATE_FILE, "r", encoding="utf-8")
+            f = open(self.state_file, "r", encoding="utf-8")
             data = json.load(f)
             f.close()
 
-            # 저장된 퀴즈 목록을 Quiz 객체로 하나씩 복원합니다.
-            self.quizzes = []
-            for q_data in data["quizzes"]:
-                question = q_data["question"]
-                choices = q_data["choices"]
-                answer = q_data["answer"]
+            # 저장된 퀴즈 목록을 복원합니다.
+            # compact 모드에서는 열 단위 저장소로 한 번에 변환합니다.
+            if self.compact:
+                self.quizzes = QuizStore.from_dicts(data["quizzes"])
 
-                # last_correct 키가 파일에 없을 수도 있으므로 확인합니다.
-                if "last_correct" in q_data:
-                    last_correct = q_data["last_correct"]
-                else:
-                    last_correct = None
+            # 아니면 Quiz 객체로 하나씩 복원합니다.
+            else:
+                self.quizzes = []
+                for q_data in data["quizzes"]:
+                    question = q_data["question"]
+                    choices = q_data["choices"]
+                    answer = q_data["answer"]
 
-                quiz = Quiz(question, choices, answer, last_correct)
-                self.quizzes.append(quiz)
+                    # last_correct 키가 파일에 없을 수도 있으므로 확인합니다.
+                    if "last_correct" in q_data:
+                        last_correct = q_data["last_correct"]
+                    else:
+                        last_correct = None
+
+                    quiz = Quiz(question, choices, answer, last_correct)
+                    self.quizzes.append(quiz)
 
             # 최고 점수를 불러옵니다.
             self.best_score = data["best_score"]
@@ -71,6 +105,12 @@ class QuizGame:
             else:
                 self.game_history = []
 
+            # 플레이어별 기록을 불러옵니다. (서버 모드를 쓴 적이 없으면 없습니다)
+            if "user_histories" in data:
+                self.user_histories = data["user_histories"]
+            else:
+                self.user_histories = {}
+
             # 불러온 정보를 화면에 출력합니다.
             total = len(self.quizzes)
             if total > 0:
@@ -79,34 +119,56 @@ class QuizGame:
                 score_percent = 0
             print(f"📂 저장된 데이터를 불러왔습니다. (퀴즈 {total}개, 최고점수 {score_percent}점)")
 
+        except QuizStoreError:
+            # 파일은 정상이지만 compact 저장소에 담을 수 없는 퀴즈가 있습니다.
+            # 기본 퀴즈로 바꾸면 다음 저장 때 사용자의 퀴즈가 지워지므로 그대로 알립니다.
+            raise
+
         except Exception:
             # 파일을 읽는 도중 어떤 오류가 나도 기본 퀴즈로 초기화합니다.
             print("⚠️  저장 파일이 손상되어 기본 문제로 다시 시작합니다.")
-            self.quizzes = []
+            self.quizzes = self.new_quiz_list()
             for quiz in DEFAULT_QUIZZES:
                 self.quizzes.append(quiz)
             self.best_score = 0
             self.game_history = []
+            self.user_histories = {}
+
+    # 빈 퀴즈 목록을 만듭니다. (compact 모드이면 QuizStore)
+    def new_quiz_list(self):
+        if self.compact:
+            return QuizStore()
+        return []
 
     # ==============================================================
     # 2. 파일 저장하기 (프로그램 변수 → state.json)
     # ==============================================================
     def save_state(self):
+        data = self.build_state_data()
+        write_state_file(data, self.state_file)
+
+    # 저장할 데이터를 딕셔너리로 묶습니다.
+    # (서버 모드에서는 이 결과를 다른 스레드에서 파일에 쓰므로 리스트는 복사해 둡니다)
+    def build_state_data(self):
         # 퀴즈 리스트를 딕셔너리 리스트로 변환합니다.
-        quiz_list = []
-        for quiz in self.quizzes:
-            quiz_list.append(quiz.to_dict())
+        if isinstance(self.quizzes, QuizStore):
+            quiz_list = self.quizzes.to_dicts()
+        else:
+            quiz_list = []
+            for quiz in self.quizzes:
+                quiz_list.append(quiz.to_dict())
+
+        # 플레이어별 기록도 리스트를 복사해서 담습니다.
+        user_histories = {}
+        for name in self.user_histories:
+            user_histories[name] = list(self.user_histories[name])
 
-        # 저장할 데이터를 딕셔너리로 묶습니다.
         data = {}
         data["quizzes"] = quiz_list
         data["best_score"] = self.best_score
-        data["game_history"] = self.game_history
-
-        # 파일에 JSON 형식으로 씁니다.
-        f = open(STATE_FILE, "w", encoding="utf-8")
-        json.dump(data, f, ensure_ascii=False, indent=2)
-        f.close()
+        data["game_history"] = list(self.game_history)
+        data["user_histories"] = user_histories
+        return data
 
     # ==============================================================
     # 3. 메뉴 출력
@@ -119,7 +181,8 @@ class QuizGame:
         print("  2. 퀴즈 추가")
         print("  3. 퀴즈 목록")
         print("  4. 점수 확인")
-        print("  5. 종료")
+        print("  5. 퀴즈 검색")
+        print("  6. 종료")
         print("========================================")
 
     # ==============================================================
@@ -143,7 +206,7 @@ class QuizGame:
 
             # 올바른 숫자(1~4)를 입력할 때까지 반복합니다.
             while True:
-                user_input = input("\n정답 입력 (1-4): ").strip()
+                user_input = self.input_func("\n정답 입력 (1-4): ").strip()
 
                 # 빈 입력 처리
                 if user_input == "":
@@ -169,27 +232,44 @@ class QuizGame:
 
             index = index + 1
 
-        # 최종 결과를 계산합니다.
-        score_percent = int(correct_count / total_count * 100)
+        # 최종 결과를 계산하고 기록합니다.
+        record, is_new_best = self.record_result(correct_count, total_count)
         print("\n========================================")
-        print(f"🏆 결과: {total_count}문제 중 {correct_count}문제 정답! ({score_percent}점)")
+        print(f"🏆 결과: {total_count}문제 중 {correct_count}문제 정답! ({record['score_percent']}점)")
 
         # 최고 점수를 경신했는지 확인합니다.
-        if correct_count > self.best_score:
-            self.best_score = correct_count
+        if is_new_best:
             print("🎉 새로운 최고 기록을 달성했습니다!")
         print("========================================")
 
-        # 이번 시행 기록을 game_history 리스트에 추가합니다.
+        # 결과를 파일에 저장합니다.
+        self.save_state()
+
+    # 한 번의 시행 결과를 기록합니다. (퀴즈 풀기와 서버 모드에서 함께 사용)
+    # player가 주어지면 game_history 대신 그 플레이어의 기록에 추가합니다.
+    def record_result(self, correct_count, total_count, player=None):
+        score_percent = int(correct_count / total_count * 100)
+
+        # 최고 점수를 경신했는지 확인합니다.
+        is_new_best = False
+        if correct_count > self.best_score:
+            self.best_score = correct_count
+            is_new_best = True
+
         record = {}
         record["date"] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         record["correct"] = correct_count
         record["total"] = total_count
         record["score_percent"] = score_percent
-        self.game_history.append(record)
 
-        # 결과를 파일에 저장합니다.
-        self.save_state()
+        if player is None:
+            self.game_history.append(record)
+        else:
+            if player not in self.user_histories:
+                self.user_histories[player] = []
+            self.user_histories[player].append(record)
+
+        return record, is_new_best
 
     # ==============================================================
     # 5. 퀴즈 추가
@@ -199,7 +279,7 @@ class QuizGame:
 
         # 1. 문제 입력 (빈 칸 입력 방지)
         while True:
-            question = input("문제를 입력하세요: ").strip()
+            question = self.input_func("문제를 입력하세요: ").strip()
             if question != "":
                 break
             print("⚠️  내용을 입력해 주세요.")
@@ -208,16 +288,27 @@ class QuizGame:
         choices = []
         i = 1
         while i <= 4:
-            choice = input(f"선택지 {i}번: ").strip()
+            choice = self.input_func(f"선택지 {i}번: ").strip()
             if choice != "":
                 choices.append(choice)
                 i = i + 1
             else:
                 print("⚠️  내용을 입력해 주세요.")
 
+        # 중복 확인: 비슷한 퀴즈가 이미 있으면 알려주고 계속할지 묻습니다.
+        similar = self.get_search_index().find_similar(question, choices)
+        if len(similar) > 0:
+            print("\n⚠️  비슷한 퀴즈가 이미 등록되어 있습니다.")
+            for quiz_id, similarity in similar:
+                print(f"  [{quiz_id + 1}] {self.quizzes[quiz_id].question} (유사도 {int(similarity * 100)}%)")
+            confirm = self.input_func("그래도 추가할까요? (y/n): ").strip().lower()
+            if confirm != "y":
+                print("\n↩️  퀴즈 추가를 취소했습니다.")
+                return
+
         # 3. 정답 번호 입력 (1~4)
         while True:
-            ans_input = input("정답 번호 (1-4): ").strip()
+            ans_input = self.input_func("정답 번호 (1-4): ").strip()
 
             if ans_input == "":
                 print("⚠️  입력값이 없습니다. 1~4 사이의 숫자를 입력해 주세요.")
@@ -230,6 +321,7 @@ class QuizGame:
         # 4. 새로운 퀴즈 객체를 만들고 리스트에 추가합니다.
         new_quiz = Quiz(question, choices, answer)
         self.quizzes.append(new_quiz)
+        self.search_index.add(new_quiz)
         self.save_state()
         print("\n✅ 퀴즈가 성공적으로 추가되었습니다!")
 
@@ -250,7 +342,38 @@ class QuizGame:
         print("----------------------------------------")
 
     # ==============================================================
-    # 7. 점수 확인
+    # 7. 퀴즈 검색
+    # ==============================================================
+    def search_quizzes(self):
+        if len(self.quizzes) == 0:
+            print("\n📭 등록된 퀴즈가 없습니다.")
+            return
+
+        while True:
+            query = self.input_func("\n검색어를 입력하세요: ").strip()
+            if query != "":
+                break
+            print("⚠️  내용을 입력해 주세요.")
+
+        results = self.get_search_index().search(query)
+        if len(results) == 0:
+            print(f"\n🔍 '{query}'와(과) 일치하는 퀴즈가 없습니다.")
+            return
+
+        print(f"\n🔍 '{query}' 검색 결과 ({len(results)}개)\n")
+        print("----------------------------------------")
+        for quiz_id, score in results:
+            print(f"  [{quiz_id + 1}] {self.quizzes[quiz_id].question}")
+        print("----------------------------------------")
+
+    # 검색 색인을 돌려줍니다. 아직 없으면 지금 퀴즈 목록으로 만듭니다.
+    def get_search_index(self):
+        if self.search_index is None:
+            self.search_index = QuizIndex(self.quizzes)
+        return self.search_index
+
+    # ==============================================================
+    # 8. 점수 확인
     # ==============================================================
     def show_score(self):
         total = len(self.quizzes)
@@ -272,14 +395,14 @@ class QuizGame:
                 i = i + 1
 
     # ==============================================================
-    # 8. 메인 게임 루프 (프로그램이 종료될 때까지 반복)
+    # 9. 메인 게임 루프 (프로그램이 종료될 때까지 반복)
     # ==============================================================
     def run(self):
         while True:
             try:
                 # 메뉴를 보여주고 입력을 받습니다.
                 self.show_menu()
-                menu_input = input("선택 (1~5): ").strip()
+                menu_input = self.input_func("선택 (1~6): ").strip()
 
                 if menu_input == "1":
                     self.play_quiz()
@@ -290,11 +413,13 @@ class QuizGame:
                 elif menu_input == "4":
                     self.show_score()
                 elif menu_input == "5":
+                    self.search_quizzes()
+                elif menu_input == "6":
                     print("\n👋 게임을 종료합니다. 안녕히 가세요!")
                     self.save_state()
                     break
                 else:
-                    print("⚠️  잘못된 입력입니다. 1번부터 5번 사이의 숫자만 적어주세요.")
+                    print("⚠️  잘못된 입력입니다. 1번부터 6번 사이의 숫자만 적어주세요.")
 
             # Ctrl+C 또는 EOF(파이프 종료) 신호가 오면 안전하게 저장 후 종료합니다.
             except (KeyboardInterrupt, EOFError):
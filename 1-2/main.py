@@ -1,12 +1,43 @@
 """
 main.py - 퀴즈 게임 진입점
+
+[실행 방법]
+    python main.py                  # 터미널에서 혼자 플레이
+    python main.py --server [포트]  # 여러 명이 접속하는 퀴즈 서버 실행
+    python main.py --compact        # 퀴즈가 아주 많을 때 메모리를 아끼는 저장소 사용
 """
 
+import argparse
+
 from game import QuizGame
+from store import QuizStoreError
 
 
 def main():
-    game = QuizGame()
+    parser = argparse.ArgumentParser(description="나만의 퀴즈 게임")
+    parser.add_argument("--server", nargs="?", type=int, const=0, default=None,
+                        metavar="PORT", help="asyncio TCP 서버 모드로 실행합니다.")
+    parser.add_argument("--host", default=None, help="서버 모드에서 사용할 주소")
+    parser.add_argument("--compact", action="store_true",
+                        help="퀴즈를 열 단위 저장소(QuizStore)에 담아 메모리를 아낍니다.")
+    args = parser.parse_args()
+
+    try:
+        if args.server is not None:
+            # 서버 모드는 필요할 때만 불러옵니다.
+            from server import run_server, DEFAULT_HOST, DEFAULT_PORT
+
+            host = args.host or DEFAULT_HOST
+            port = args.server or DEFAULT_PORT
+            run_server(host, port, args.compact)
+            return
+
+        game = QuizGame(compact=args.compact)
+    except QuizStoreError as e:
+        # state.json은 건드리지 않고 종료합니다.
+        print(f"⚠️  compact 모드로 불러올 수 없는 퀴즈가 있습니다. ({e})")
+        print("   state.json은 그대로 두었습니다. --compact 없이 실행하거나 파일을 고쳐 주세요.")
+        raise SystemExit(1)
     game.run()
 
 
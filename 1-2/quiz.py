@@ -4,6 +4,9 @@ quiz.py - 퀴즈 한 개를 나타내는 클래스
 
 
 class Quiz:
+    # __slots__: 객체마다 __dict__를 만들지 않아 퀴즈가 많을 때 메모리를 아낍니다.
+    __slots__ = ("question", "choices", "answer", "last_correct")
+
     # __init__: 퀴즈 객체를 처음 만들 때 실행되는 함수입니다.
     def __init__(self, question, choices, answer, last_correct=None):
         self.question = question        # 문제 내용
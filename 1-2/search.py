@@ -0,0 +1,162 @@
+"""
+search.py - 퀴즈 검색과 중복 확인을 위한 역색인(inverted index)
+
+[동작 방식]
+- 문제와 선택지를 정규화(NFKC + 소문자)한 뒤 토큰으로 나눕니다.
+  · 먼저 영어/숫자 부분과 한글 등 나머지 부분을 나눕니다.  예) "python에서" → "python", "에서"
+  · 영어/숫자 부분은 단어 그대로 토큰이 됩니다.  예) "python"
+  · 한글처럼 띄어쓰기만으로 나누기 어려운 부분은 두 글자씩 끊은
+    문자 n-gram(bigram)을 토큰으로 씁니다.      예) "딕셔너리" → "딕셔", "셔너", "너리"
+- 토큰마다 그 토큰이 들어 있는 퀴즈 번호 목록(postings)을 저장합니다.
+- 검색할 때는 전체 퀴즈를 훑지 않고, 드문 토큰의 목록부터 모아 후보를 만듭니다.
+  · 검색: postings를 최대 SCAN_LIMIT개만 훑습니다. 가장 드문 토큰조차 그보다 흔하면
+    그 목록의 앞쪽(번호가 작은) SCAN_LIMIT개만 후보로 삼으므로, 결과는 번호가 작은
+    퀴즈 위주의 근사 결과가 됩니다. (점수가 같으면 원래도 번호가 작은 퀴즈가 먼저입니다)
+  · 중복 확인: 빠뜨리는 퀴즈가 없어야 하므로 상한 없이, 유사도 기준으로 꼭 필요한
+    드문 토큰들의 postings만 훑습니다.
+"""
+
+import heapq
+from collections import Counter
+import math
+import re
+import unicodedata
+
+NGRAM_SIZE = 2              # 한글 등에 사용할 문자 n-gram 길이
+DUPLICATE_THRESHOLD = 0.8   # 이 값 이상이면 비슷한(중복 의심) 퀴즈로 봅니다
+SCAN_LIMIT = 1000           # 검색할 때 직접 훑는 postings 개수 상한 (= 후보 수 상한)
+
+# 영어/숫자 묶음 또는 그 밖의 글자(한글 등) 묶음. "python에서" 같은 단어는 두 묶음으로 나뉩니다.
+WORD_PATTERN = re.compile(r"[a-z0-9_]+|[^\W\da-z_]+")
+
+
+# 텍스트를 정규화하고 토큰 리스트로 나눕니다.
+def tokenize(text):
+    text = unicodedata.normalize("NFKC", text).lower()
+    tokens = []
+    for word in WORD_PATTERN.findall(text):
+        if word.isascii() or len(word) <= NGRAM_SIZE:
+            tokens.append(word)
+        else:
+            for i in range(len(word) - NGRAM_SIZE + 1):
+                tokens.append(word[i:i + NGRAM_SIZE])
+    return tokens
+
+
+# 퀴즈 하나(문제 + 선택지)의 토큰 집합을 만듭니다.
+def quiz_tokens(question, choices):
+    tokens = set(tokenize(question))
+    for choice in choices:
+        tokens.update(tokenize(choice))
+    return frozenset(tokens)
+
+
+class QuizIndex:
+    # ==============================================================
+    # 빈 색인 만들기 (quizzes를 주면 한 번에 색인합니다)
+    # ==============================================================
+    def __init__(self, quizzes=None):
+        self.postings = {}     # 토큰 → 퀴즈 번호(0부터) 리스트
+        self.token_sets = []   # 퀴즈 번호 → 그 퀴즈의 토큰 집합
+
+        if quizzes is not None:
+            for quiz in quizzes:
+                self.add(quiz)
+
+    def __len__(self):
+        return len(self.token_sets)
+
+    # 퀴즈 하나를 색인에 추가합니다. (퀴즈 목록에 추가된 순서대로 호출해야 합니다)
+    def add(self, quiz):
+        quiz_id = len(self.token_sets)
+        tokens = quiz_tokens(quiz.question, quiz.choices)
+        self.token_sets.append(tokens)
+        for token in tokens:
+            if token in self.postings:
+                self.postings[token].append(quiz_id)
+            else:
+                self.postings[token] = [quiz_id]
+
+    # 주어진 토큰 집합과 겹치는 토큰 수를 퀴즈 번호별로 셉니다.
+    def count_matches(self, tokens):
+        # 드문 토큰(목록이 짧은 토큰)부터 처리합니다.
+        ordered = sorted(tokens, key=lambda t: len(self.postings.get(t, ())))
+
+        counts = Counter()
+        scanned = 0
+        rest_start = len(ordered)
+        for i in range(len(ordered)):
+            posting = self.postings.get(ordered[i], ())
+            if scanned + len(posting) > SCAN_LIMIT:
+                if counts:
+                    # 흔한 토큰의 긴 목록은 직접 훑지 않고, 이미 모은 후보에서만 확인합니다.
+                    rest_start = i
+                else:
+                    # 가장 드문 토큰도 흔하면 목록 앞쪽 SCAN_LIMIT개만 후보로 삼습니다.
+                    counts.update(posting[:SCAN_LIMIT])
+                    rest_start = i + 1
+                break
+            counts.update(posting)
+            scanned = scanned + len(posting)
+
+        rest = frozenset(ordered[rest_start:])
+        if rest:
+            for quiz_id in counts:
+                counts[quiz_id] = counts[quiz_id] + len(rest & self.token_sets[quiz_id])
+        return counts
+
+    # ==============================================================
+    # 검색: 검색어와 많이 겹치는 퀴즈 번호를 점수순으로 돌려줍니다.
+    # ==============================================================
+    def search(self, query, limit=10):
+        tokens = set(tokenize(query))
+        if not tokens:
+            return []
+
+        counts = self.count_matches(tokens)
+        best = heapq.nlargest(limit, counts.items(), key=lambda item: (item[1], -item[0]))
+
+        results = []
+        for quiz_id, count in best:
+            results.append((quiz_id, count / len(tokens)))
+        return results
+
+    # ==============================================================
+    # 중복 확인: 비슷한 퀴즈 번호와 유사도(자카드 계수)를 돌려줍니다.
+    # ==============================================================
+    def find_similar(self, question, choices, threshold=DUPLICATE_THRESHOLD, limit=3):
+        tokens = quiz_tokens(question, choices)
+        if not tokens:
+            return []
+
+        # 유사도가 threshold 이상인 퀴즈는 새 퀴즈 토큰을 min_common개 이상 가지고 있어야
+        # 하므로, 가장 드문 토큰 (len(tokens) - min_common + 1)개 중 하나는 꼭 가집니다.
+        # (부동소수점 오차로 ceil이 1 커지지 않도록 아주 작은 값을 뺍니다)
+        ordered = sorted(tokens, key=lambda t: len(self.postings.get(t, ())))
+        min_common = math.ceil(threshold * len(tokens) - 1e-9)
+        prefix_length = len(tokens) - min_common + 1
+
+        # 그다음 토큰도 목록이 지금까지 모은 후보 수보다 짧으면 더 훑습니다.
+        # 토큰을 하나 더 훑을 때마다 후보가 가져야 하는 최소 일치 수가 1씩 올라가므로,
+        # 유사도를 직접 계산할 후보가 크게 줄어듭니다.
+        counts = Counter()
+        scanned_tokens = 0
+        for token in ordered:
+            posting = self.postings.get(token, ())
+            if scanned_tokens >= prefix_length and len(posting) > len(counts):
+                break
+            counts.update(posting)
+            scanned_tokens = scanned_tokens + 1
+        min_hits = max(1, min_common - (len(tokens) - scanned_tokens))
+
+        similar = []
+        for quiz_id, hits in counts.items():
+            if hits < min_hits:
+                continue
+            token_set = self.token_sets[quiz_id]
+            common = len(tokens & token_set)
+            similarity = common / (len(tokens) + len(token_set) - common)
+            if similarity >= threshold:
+                similar.append((quiz_id, similarity))
+
+        return heapq.nlargest(limit, similar, key=lambda item: item[1])
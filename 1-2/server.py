@@ -0,0 +1,290 @@
+"""
+server.py - 여러 플레이어가 동시에 접속해 퀴즈를 푸는 asyncio TCP 서버
+
+[구조]
+- 퀴즈 목록(QuizGame)은 서버 전체에서 하나만 메모리에 올려 함께 사용합니다.
+- 접속(연결) 하나마다 handle_client가 독립된 세션으로 동작합니다.
+- state.json은 StateWriter 하나만 씁니다. 여러 세션의 결과를 잠시 모았다가
+  한 번에 저장하므로, 동시 접속자가 많아도 파일이 서로 덮어써지지 않습니다.
+
+[프로토콜] 한 줄 = 한 메시지 (UTF-8, 줄바꿈으로 구분)
+  클라이언트 → 서버
+    NAME <이름>   : 플레이어 이름 등록 (PLAY, SCORE 전에 필요)
+    PLAY          : 퀴즈 풀기 시작 (문제마다 1~4 중 하나를 한 줄로 보냄)
+    LIST          : 퀴즈 목록
+    SEARCH <검색어> : 퀴즈 검색
+    SCORE         : 전체 최고 점수와 내 시행 기록
+    QUIT          : 접속 종료
+  서버 → 클라이언트
+    HELLO <퀴즈 수>                  : 접속 직후 한 번
+    OK <내용> / ERR <안내 메시지>
+    Q <번호> <문제> + C <번호> <선택지> x4 + END : 문제 하나
+    CORRECT / WRONG <정답 번호>      : 채점 결과
+    RESULT <정답 수> <문제 수> <점수> : 시행 종료
+    QUIZ <번호> <문제> ... END       : LIST, SEARCH 결과
+    BEST <점수> / HISTORY <날짜> <정답 수> <문제 수> <점수> ... END : SCORE 결과
+    BYE                              : QUIT 응답
+
+[실행 예시]
+    python main.py --server 8765
+    nc 127.0.0.1 8765
+"""
+
+import asyncio
+import contextlib
+
+from game import QuizGame, write_state_file
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+FLUSH_INTERVAL = 0.5  # 저장 요청을 모으는 시간 (초)
+
+
+class StateWriter:
+    # ==============================================================
+    # state.json을 쓰는 유일한 작업(task)
+    # ==============================================================
+    def __init__(self, game, interval=FLUSH_INTERVAL):
+        self.game = game
+        self.interval = interval
+        self.dirty = asyncio.Event()  # 저장할 변경 사항이 있는지 표시
+        self.write_count = 0          # 실제로 파일에 쓴 횟수
+        self.writing = None           # 진행 중(또는 마지막)인 파일 쓰기 작업
+        self.task = None              # run()을 실행하는 작업
+
+    # 저장 작업을 시작합니다.
+    def start(self):
+        self.task = asyncio.create_task(self.run())
+
+    # 저장 작업을 멈추고 남은 변경 사항을 저장합니다. (서버 종료 시 사용)
+    async def close(self):
+        if self.task is not None:
+            self.task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.task
+
+        # 취소해도 이미 시작된 파일 쓰기 스레드는 멈추지 않으므로 끝날 때까지 기다립니다.
+        # (같은 임시 파일에 두 스레드가 동시에 쓰지 않도록)
+        if self.writing is not None:
+            with contextlib.suppress(Exception):
+                await self.writing
+
+        await self.flush()
+
+    # 세션이 결과를 기록한 뒤 호출합니다. (바로 쓰지 않고 표시만 합니다)
+    def mark_dirty(self):
+        self.dirty.set()
+
+    # 변경 사항이 생기면 interval초 동안 더 모은 뒤 한 번에 저장합니다.
+    async def run(self):
+        while True:
+            await self.dirty.wait()
+            await asyncio.sleep(self.interval)
+            await self.flush()
+
+    # 남은 변경 사항을 즉시 저장합니다.
+    async def flush(self):
+        if not self.dirty.is_set():
+            return
+        self.dirty.clear()
+
+        # 데이터 묶기는 이벤트 루프에서, 파일 쓰기는 별도 스레드에서 합니다.
+        data = self.game.build_state_data()
+        loop = asyncio.get_running_loop()
+        self.writing = loop.run_in_executor(None, write_state_file, data, self.game.state_file)
+        try:
+            # shield: 이 작업이 취소되어도 쓰기 작업 자체는 취소된 것으로 표시하지 않습니다.
+            await asyncio.shield(self.writing)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # 저장에 실패하면 변경 사항을 다시 표시해 다음 주기에 다시 시도합니다.
+            print(f"⚠️  상태 저장에 실패했습니다. 잠시 후 다시 시도합니다. ({e})")
+            self.dirty.set()
+            return
+        self.write_count = self.write_count + 1
+
+
+class QuizServer:
+    # ==============================================================
+    # 서버 시작 시 공용 퀴즈 목록과 저장 작업 준비
+    # ==============================================================
+    def __init__(self, game=None, flush_interval=FLUSH_INTERVAL):
+        if game is None:
+            game = QuizGame()
+        self.game = game
+        self.writer = StateWriter(game, flush_interval)
+        self.address = None  # 실제로 열린 (주소, 포트) (포트 0이면 운영체제가 정합니다)
+
+    # 한 줄을 보냅니다.
+    async def send(self, writer, line):
+        writer.write((line + "\n").encode("utf-8"))
+        await writer.drain()
+
+    # 한 줄을 받습니다. 접속이 끊기면 None을 돌려줍니다.
+    async def receive(self, reader):
+        data = await reader.readline()
+        if data == b"":
+            return None
+        return data.decode("utf-8", errors="replace").strip()
+
+    # ==============================================================
+    # 접속 하나를 처리하는 세션
+    # ==============================================================
+    async def handle_client(self, reader, writer):
+        player = None
+        try:
+            await self.send(writer, f"HELLO {len(self.game.quizzes)}")
+
+            while True:
+                line = await self.receive(reader)
+                if line is None:
+                    break
+
+                # 명령어와 나머지 내용을 나눕니다. 예) "NAME 철수" → "NAME", "철수"
+                parts = line.split(" ", 1)
+                command = parts[0].upper()
+                if len(parts) > 1:
+                    argument = parts[1].strip()
+                else:
+                    argument = ""
+
+                if command == "NAME":
+                    if argument == "":
+                        await self.send(writer, "ERR 이름을 입력해 주세요.")
+                    else:
+                        player = argument
+                        await self.send(writer, f"OK {player}")
+                elif command == "PLAY":
+                    if player is None:
+                        await self.send(writer, "ERR 먼저 NAME <이름>으로 이름을 등록해 주세요.")
+                    else:
+                        finished = await self.play_session(reader, writer, player)
+                        if not finished:
+                            break
+                elif command == "LIST":
+                    await self.send_list(writer)
+                elif command == "SEARCH":
+                    if argument == "":
+                        await self.send(writer, "ERR 검색어를 입력해 주세요.")
+                    else:
+                        await self.send_search(writer, argument)
+                elif command == "SCORE":
+                    if player is None:
+                        await self.send(writer, "ERR 먼저 NAME <이름>으로 이름을 등록해 주세요.")
+                    else:
+                        await self.send_score(writer, player)
+                elif command == "QUIT":
+                    await self.send(writer, "BYE")
+                    break
+                else:
+                    await self.send(writer, "ERR 알 수 없는 명령입니다. (NAME, PLAY, LIST, SEARCH, SCORE, QUIT)")
+
+        except (ConnectionError, asyncio.IncompleteReadError):
+            # 클라이언트가 갑자기 접속을 끊은 경우입니다.
+            pass
+        finally:
+            writer.close()
+
+    # ==============================================================
+    # 퀴즈 풀기 세션 (끝까지 풀면 True, 도중에 접속이 끊기면 False)
+    # ==============================================================
+    async def play_session(self, reader, writer, player):
+        # 세션 도중 목록이 바뀌어도 영향이 없도록 시작 시점의 목록을 사용합니다.
+        quizzes = list(self.game.quizzes)
+        total_count = len(quizzes)
+        if total_count == 0:
+            await self.send(writer, "ERR 등록된 퀴즈가 없습니다.")
+            return True
+
+        correct_count = 0
+        index = 1
+        for quiz in quizzes:
+            await self.send(writer, f"Q {index} {quiz.question}")
+            for i in range(len(quiz.choices)):
+                await self.send(writer, f"C {i + 1} {quiz.choices[i]}")
+            await self.send(writer, "END")
+
+            # 올바른 숫자(1~4)를 받을 때까지 반복합니다.
+            while True:
+                answer_input = await self.receive(reader)
+                if answer_input is None:
+                    return False
+                if answer_input in ("1", "2", "3", "4"):
+                    break
+                await self.send(writer, "ERR 1~4 사이의 숫자만 입력해 주세요.")
+
+            # 여러 명이 같은 퀴즈를 풀기 때문에 퀴즈의 last_correct는 바꾸지 않습니다.
+            if quiz.check_answer(int(answer_input)):
+                correct_count = correct_count + 1
+                await self.send(writer, "CORRECT")
+            else:
+                await self.send(writer, f"WRONG {quiz.answer}")
+
+            index = index + 1
+
+        record, is_new_best = self.game.record_result(correct_count, total_count, player)
+        self.writer.mark_dirty()
+        await self.send(writer, f"RESULT {correct_count} {total_count} {record['score_percent']}")
+        if is_new_best:
+            await self.send(writer, "OK 새로운 최고 기록을 달성했습니다!")
+        return True
+
+    # 퀴즈 목록을 보냅니다.
+    async def send_list(self, writer):
+        index = 1
+        for quiz in self.game.quizzes:
+            await self.send(writer, f"QUIZ {index} {quiz.question}")
+            index = index + 1
+        await self.send(writer, "END")
+
+    # 검색 결과를 보냅니다. (번호는 LIST와 같은 퀴즈 번호입니다)
+    async def send_search(self, writer, query):
+        for quiz_id, score in self.game.get_search_index().search(query):
+            await self.send(writer, f"QUIZ {quiz_id + 1} {self.game.quizzes[quiz_id].question}")
+        await self.send(writer, "END")
+
+    # 전체 최고 점수와 이 플레이어의 시행 기록을 보냅니다.
+    async def send_score(self, writer, player):
+        total = len(self.game.quizzes)
+        if total > 0:
+            score_percent = int(self.game.best_score / total * 100)
+        else:
+            score_percent = 0
+        await self.send(writer, f"BEST {score_percent}")
+
+        if player in self.game.user_histories:
+            for record in self.game.user_histories[player]:
+                await self.send(writer, f"HISTORY {record['date']} {record['correct']} "
+                                        f"{record['total']} {record['score_percent']}")
+        await self.send(writer, "END")
+
+    # ==============================================================
+    # 서버 실행 (Ctrl+C로 종료할 때까지)
+    # ==============================================================
+    # 접속을 받기 시작하고 저장 작업을 켭니다. (종료는 server.close() 후 writer.close())
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        server = await asyncio.start_server(self.handle_client, host, port)
+        self.address = server.sockets[0].getsockname()[:2]
+        self.writer.start()
+        return server
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        server = await self.start(host, port)
+        print(f"🌐 퀴즈 서버가 시작되었습니다. ({self.address[0]}:{self.address[1]}, "
+              f"퀴즈 {len(self.game.quizzes)}개)")
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            # 종료 전에 아직 저장하지 않은 기록을 모두 씁니다.
+            await self.writer.close()
+
+
+def run_server(host=DEFAULT_HOST, port=DEFAULT_PORT, compact=False):
+    quiz_server = QuizServer(QuizGame(compact=compact))
+    try:
+        asyncio.run(quiz_server.serve(host, port))
+    except KeyboardInterrupt:
+        print("\n👋 퀴즈 서버를 종료합니다.")
@@ -0,0 +1,178 @@
+"""
+store.py - 많은 퀴즈를 적은 메모리로 보관하는 열(column) 단위 저장소
+
+[구조]
+Quiz 객체를 퀴즈마다 하나씩 만드는 대신, 같은 종류의 값끼리 나란히 모아 둡니다.
+- questions       : 문제 문자열 리스트
+- choices         : 모든 퀴즈의 선택지를 이어 붙인 리스트
+- choice_starts   : 퀴즈 i의 선택지는 choices[choice_starts[i]:choice_starts[i + 1]]
+- answers         : 정답 번호 array('b')  (1바이트)
+- last_correct    : 마지막 정답 여부 array('b')  (-1 = None, 0 = False, 1 = True)
+문자열은 sys.intern으로 같은 내용을 하나의 객체로 공유합니다. (예: 자주 나오는 선택지)
+
+store[i]나 for 반복문으로 꺼내면 QuizView가 나옵니다.
+QuizView는 Quiz와 같은 속성/메서드를 가지며, 값을 복사하지 않고 저장소를 직접 읽고 씁니다.
+
+배열에 담을 수 없는 값(예: 정답 "2", 범위를 벗어난 정답 번호)이 있으면
+값을 바꾸거나 버리지 않고 QuizStoreError를 발생시킵니다.
+"""
+
+import sys
+from array import array
+
+from quiz import Quiz
+
+# last_correct 값(True/False/None) ↔ array('b')에 저장하는 숫자
+LAST_CORRECT_CODES = {None: -1, False: 0, True: 1}
+LAST_CORRECT_VALUES = (None, False, True)  # 인덱스 = 숫자 + 1
+ANSWER_MIN = -128  # array('b')에 담을 수 있는 정답 번호 범위
+ANSWER_MAX = 127
+
+
+class QuizStoreError(ValueError):
+    # 퀴즈 하나를 저장소에 그대로 담을 수 없을 때 발생합니다. (number는 1부터 센 퀴즈 번호)
+    def __init__(self, number, reason):
+        self.number = number
+        self.reason = reason
+        super().__init__(f"{number}번 퀴즈: {reason}")
+
+
+# 저장소에 그대로 담을 수 없는 값이면 그 이유를, 문제가 없으면 None을 돌려줍니다.
+def invalid_reason(question, choices, answer, last_correct):
+    if type(question) is not str:
+        return f"문제 {question!r}가 문자열이 아닙니다."
+    if type(choices) is not list or not all(type(choice) is str for choice in choices):
+        return f"선택지 {choices!r}가 문자열 리스트가 아닙니다."
+    if type(answer) is not int or not ANSWER_MIN <= answer <= ANSWER_MAX:
+        return f"정답 번호 {answer!r}는 {ANSWER_MIN}~{ANSWER_MAX} 사이의 정수여야 합니다."
+    if last_correct is not None and type(last_correct) is not bool:
+        return f"last_correct {last_correct!r}는 true/false/null 중 하나여야 합니다."
+    return None
+
+
+class QuizView:
+    # 저장소의 i번째 퀴즈를 Quiz처럼 다루기 위한 가벼운 객체입니다.
+    __slots__ = ("store", "index")
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    @property
+    def question(self):
+        return self.store.questions[self.index]
+
+    @property
+    def choices(self):
+        starts = self.store.choice_starts
+        return self.store.choices[starts[self.index]:starts[self.index + 1]]
+
+    @property
+    def answer(self):
+        return self.store.answers[self.index]
+
+    @property
+    def last_correct(self):
+        return LAST_CORRECT_VALUES[self.store.last_correct[self.index] + 1]
+
+    @last_correct.setter
+    def last_correct(self, value):
+        self.store.last_correct[self.index] = LAST_CORRECT_CODES[value]
+
+    # 화면 출력, 채점, 저장용 변환은 Quiz의 메서드를 그대로 사용합니다.
+    display = Quiz.display
+    check_answer = Quiz.check_answer
+    to_dict = Quiz.to_dict
+
+
+class QuizStore:
+    # ==============================================================
+    # 빈 저장소 만들기
+    # ==============================================================
+    def __init__(self):
+        self.questions = []
+        self.choices = []
+        self.choice_starts = array("I", [0])
+        self.answers = array("b")
+        self.last_correct = array("b")
+
+    def __len__(self):
+        return len(self.questions)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index = index + len(self.questions)
+        if index < 0 or index >= len(self.questions):
+            raise IndexError("퀴즈 번호가 범위를 벗어났습니다.")
+        return QuizView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self.questions)):
+            yield QuizView(self, index)
+
+    # 퀴즈 하나를 추가합니다.
+    def add(self, question, choices, answer, last_correct=None):
+        reason = invalid_reason(question, choices, answer, last_correct)
+        if reason is not None:
+            raise QuizStoreError(len(self.questions) + 1, reason)
+        self.questions.append(sys.intern(question))
+        for choice in choices:
+            self.choices.append(sys.intern(choice))
+        self.choice_starts.append(len(self.choices))
+        self.answers.append(answer)
+        self.last_correct.append(LAST_CORRECT_CODES[last_correct])
+
+    # Quiz(또는 QuizView) 객체의 값을 복사해 추가합니다. (list.append와 같은 쓰임)
+    def append(self, quiz):
+        self.add(quiz.question, quiz.choices, quiz.answer, quiz.last_correct)
+
+    # ==============================================================
+    # state.json의 퀴즈 딕셔너리 리스트 → 저장소 (한 번에 변환)
+    # ==============================================================
+    @classmethod
+    def from_dicts(cls, quiz_dicts):
+        store = cls()
+        intern = sys.intern
+        questions = store.questions
+        choices = store.choices
+        choice_starts = store.choice_starts
+        answers = []
+        last_correct = []
+
+        number = 0
+        for q_data in quiz_dicts:
+            number = number + 1
+            question = q_data["question"]
+            quiz_choices = q_data["choices"]
+            answer = q_data["answer"]
+            # last_correct 키가 없을 수도 있으므로 None으로 처리합니다.
+            value = q_data.get("last_correct")
+            reason = invalid_reason(question, quiz_choices, answer, value)
+            if reason is not None:
+                raise QuizStoreError(number, reason)
+
+            questions.append(intern(question))
+            choices.extend(map(intern, quiz_choices))
+            choice_starts.append(len(choices))
+            answers.append(answer)
+            last_correct.append(LAST_CORRECT_CODES[value])
+
+        store.answers = array("b", answers)
+        store.last_correct = array("b", last_correct)
+        return store
+
+    # ==============================================================
+    # 저장소 → state.json의 퀴즈 딕셔너리 리스트 (한 번에 변환)
+    # ==============================================================
+    def to_dicts(self):
+        quiz_list = []
+        choices = self.choices
+        starts = self.choice_starts
+        for i in range(len(self.questions)):
+            quiz_dict = {}
+            quiz_dict["question"] = self.questions[i]
+            quiz_dict["choices"] = choices[starts[i]:starts[i + 1]]
+            quiz_dict["answer"] = self.answers[i]
+            quiz_dict["last_correct"] = LAST_CORRECT_VALUES[self.last_correct[i] + 1]
+            quiz_list.append(quiz_dict)
+        return quiz_list
@@ -0,0 +1,72 @@
+"""
+test_search.py - 역색인(search.py)의 검색과 중복 확인 테스트
+
+    python -m unittest discover tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from quiz import DEFAULT_QUIZZES, Quiz  # noqa: E402
+from search import SCAN_LIMIT, QuizIndex, quiz_tokens, tokenize  # noqa: E402
+
+
+class TokenizeTest(unittest.TestCase):
+    def test_english_word_with_korean_particle(self):
+        # 영어 단어에 붙은 조사는 따로 나뉘고, 영어 단어는 통째로 토큰이 됩니다.
+        self.assertEqual(tokenize("Python에서 리스트(list)를"),
+                         ["python", "에서", "리스", "스트", "list", "를"])
+        self.assertNotIn("on", tokenize("Python을 만든 사람"))
+
+
+class FindSimilarTest(unittest.TestCase):
+    def test_threshold_boundary_is_found(self):
+        # 자카드 계수가 정확히 0.8인 퀴즈도 찾아야 합니다.
+        index = QuizIndex([Quiz("bb cc dd ee", ["a", "b", "c", "d"], 1)])
+        similar = index.find_similar("aa bb cc dd ee", ["a", "b", "c", "d"], threshold=0.8)
+        self.assertEqual([quiz_id for quiz_id, _ in similar], [0])
+
+    def test_matches_brute_force(self):
+        words = [f"w{i}" for i in range(12)]
+        quizzes = []
+        for i in range(200):
+            question = " ".join(words[j] for j in range(12) if (i * 7 + j * 3) % 5 < 3)
+            quizzes.append(Quiz(question, [], 1))
+        index = QuizIndex(quizzes)
+
+        for threshold in (0.5, 0.7, 0.8, 1.0):
+            for quiz in quizzes[:20]:
+                tokens = quiz_tokens(quiz.question, [])
+                expected = []
+                for quiz_id in range(len(index)):
+                    token_set = index.token_sets[quiz_id]
+                    if len(tokens & token_set) / len(tokens | token_set) >= threshold:
+                        expected.append(quiz_id)
+                found = index.find_similar(quiz.question, [], threshold, limit=len(quizzes))
+                self.assertEqual(sorted(quiz_id for quiz_id, _ in found), expected)
+
+
+class SearchTest(unittest.TestCase):
+    def test_python_matches_every_default_quiz(self):
+        index = QuizIndex(DEFAULT_QUIZZES)
+        results = index.search("python")
+        self.assertEqual(sorted(quiz_id for quiz_id, _ in results), list(range(len(DEFAULT_QUIZZES))))
+
+    def test_common_query_scans_at_most_scan_limit(self):
+        index = QuizIndex([Quiz(f"python {i}", [], 1) for i in range(SCAN_LIMIT * 3)])
+        counts = index.count_matches({"python"})
+        self.assertEqual(len(counts), SCAN_LIMIT)
+        # 점수가 같으면 번호가 작은 퀴즈가 먼저입니다.
+        self.assertEqual(index.search("python", limit=3), [(0, 1.0), (1, 1.0), (2, 1.0)])
+
+    def test_rare_token_ranks_first(self):
+        quizzes = [Quiz(f"python 리스트 {i}", [], 1) for i in range(SCAN_LIMIT * 2)]
+        index = QuizIndex(quizzes)
+        self.assertEqual(index.search("python 1500")[0], (1500, 1.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
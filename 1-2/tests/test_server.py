@@ -0,0 +1,166 @@
+"""
+test_server.py - 퀴즈 서버(server.py)를 실제 TCP 접속으로 확인하는 테스트
+
+    python -m unittest discover tests
+"""
+
+import asyncio
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import QuizGame  # noqa: E402
+from server import QuizServer  # noqa: E402
+
+
+class QuizServerTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.state_file = os.path.join(self.work_dir.name, "state.json")
+        with contextlib.redirect_stdout(io.StringIO()):
+            game = QuizGame(state_file=self.state_file)
+        self.quiz_server = QuizServer(game, flush_interval=0.2)
+        self.server = await self.quiz_server.start("127.0.0.1", 0)
+        self.answers = [str(quiz.answer) for quiz in game.quizzes]
+
+    async def asyncTearDown(self):
+        await self.shutdown()
+        self.work_dir.cleanup()
+
+    async def shutdown(self):
+        if self.server is None:
+            return
+        self.server.close()
+        await self.server.wait_closed()
+        await self.quiz_server.writer.close()
+        self.server = None
+
+    async def connect(self):
+        host, port = self.quiz_server.address
+        reader, writer = await asyncio.open_connection(host, port)
+        hello = await self.receive(reader)
+        self.assertEqual(hello, f"HELLO {len(self.answers)}")
+        return reader, writer
+
+    async def send(self, writer, line):
+        writer.write((line + "\n").encode("utf-8"))
+        await writer.drain()
+
+    async def receive(self, reader):
+        data = await asyncio.wait_for(reader.readline(), timeout=5)
+        return data.decode("utf-8").rstrip("\n")
+
+    # END가 나올 때까지 받은 줄을 모읍니다.
+    async def receive_until_end(self, reader):
+        lines = []
+        while True:
+            line = await self.receive(reader)
+            if line == "END":
+                return lines
+            lines.append(line)
+
+    # NAME → PLAY(wrong_count개만 틀리게) → SCORE → QUIT 한 번을 진행합니다.
+    async def play(self, name, wrong_count=0):
+        reader, writer = await self.connect()
+        await self.send(writer, f"NAME {name}")
+        self.assertEqual(await self.receive(reader), f"OK {name}")
+
+        await self.send(writer, "PLAY")
+        for index, answer in enumerate(self.answers):
+            question = await self.receive_until_end(reader)
+            self.assertTrue(question[0].startswith(f"Q {index + 1} "))
+            self.assertEqual(len(question), 5)
+            if index < wrong_count:
+                answer = str(int(answer) % 4 + 1)
+                await self.send(writer, answer)
+                self.assertEqual(await self.receive(reader), f"WRONG {self.answers[index]}")
+            else:
+                await self.send(writer, answer)
+                self.assertEqual(await self.receive(reader), "CORRECT")
+
+        correct = len(self.answers) - wrong_count
+        result = await self.receive(reader)
+        self.assertEqual(result.split()[:3], ["RESULT", str(correct), str(len(self.answers))])
+
+        await self.send(writer, "SCORE")
+        lines = await self.receive_until_end(reader)
+        # 새 최고 기록이면 RESULT 뒤에 OK 안내가 한 줄 더 옵니다.
+        lines = [line for line in lines if not line.startswith("OK ")]
+        self.assertTrue(lines[0].startswith("BEST "))
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[1].startswith("HISTORY "))
+        self.assertEqual(lines[1].split()[-3:-1], [str(correct), str(len(self.answers))])
+
+        await self.send(writer, "QUIT")
+        self.assertEqual(await self.receive(reader), "BYE")
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_commands_require_name(self):
+        reader, writer = await self.connect()
+        await self.send(writer, "PLAY")
+        self.assertTrue((await self.receive(reader)).startswith("ERR "))
+        await self.send(writer, "SCORE")
+        self.assertTrue((await self.receive(reader)).startswith("ERR "))
+        await self.send(writer, "QUIT")
+        self.assertEqual(await self.receive(reader), "BYE")
+        writer.close()
+        await writer.wait_closed()
+
+    async def test_single_session_saved_on_shutdown(self):
+        await self.play("alice", wrong_count=1)
+        await self.shutdown()
+
+        with open(self.state_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertEqual(list(data["user_histories"]), ["alice"])
+        record = data["user_histories"]["alice"][0]
+        self.assertEqual(record["correct"], len(self.answers) - 1)
+        self.assertEqual(record["total"], len(self.answers))
+        self.assertEqual(data["best_score"], len(self.answers) - 1)
+        self.assertEqual(len(data["quizzes"]), len(self.answers))
+        self.assertFalse(os.path.exists(self.state_file + ".tmp"))
+
+    async def test_concurrent_players_batched_into_few_writes(self):
+        player_count = 30
+        await asyncio.gather(*[self.play(f"player{i}", wrong_count=i % len(self.answers))
+                               for i in range(player_count)])
+        await self.shutdown()
+
+        with open(self.state_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertEqual(len(data["user_histories"]), player_count)
+        for i in range(player_count):
+            records = data["user_histories"][f"player{i}"]
+            self.assertEqual(len(records), 1)
+            self.assertEqual(records[0]["correct"], len(self.answers) - i % len(self.answers))
+        self.assertEqual(data["best_score"], len(self.answers))
+        # 결과마다 파일을 쓰지 않고 모아서 씁니다.
+        self.assertLess(self.quiz_server.writer.write_count, player_count)
+
+    async def test_failed_write_is_retried(self):
+        # 저장 폴더가 없으면 쓰기가 실패하고, 폴더가 생긴 뒤 다시 시도해 저장해야 합니다.
+        missing_dir = os.path.join(self.work_dir.name, "missing")
+        self.quiz_server.game.state_file = os.path.join(missing_dir, "state.json")
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            await self.play("bob")
+            await asyncio.sleep(0.4)
+            self.assertIn("상태 저장에 실패했습니다", output.getvalue())
+            self.assertEqual(self.quiz_server.writer.write_count, 0)
+
+            os.mkdir(missing_dir)
+            await asyncio.sleep(0.5)
+        self.assertEqual(self.quiz_server.writer.write_count, 1)
+        with open(self.quiz_server.game.state_file, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self.assertIn("bob", data["user_histories"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+test_store.py - 열 단위 퀴즈 저장소(store.py)와 compact 모드 불러오기 테스트
+
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import QuizGame  # noqa: E402
+from quiz import Quiz  # noqa: E402
+from store import QuizStore, QuizStoreError  # noqa: E402
+
+
+def make_dicts():
+    return [
+        {"question": "첫 번째", "choices": ["a", "b", "c", "d"], "answer": 1, "last_correct": None},
+        {"question": "두 번째", "choices": ["a", "b", "c", "d"], "answer": 4, "last_correct": True},
+        {"question": "세 번째", "choices": ["e", "f", "g", "h"], "answer": 2, "last_correct": False},
+    ]
+
+
+class QuizStoreTest(unittest.TestCase):
+    def test_round_trip(self):
+        quiz_dicts = make_dicts()
+        store = QuizStore.from_dicts(quiz_dicts)
+        self.assertEqual(len(store), 3)
+        self.assertEqual(store.to_dicts(), quiz_dicts)
+        self.assertEqual([quiz.last_correct for quiz in store], [None, True, False])
+        self.assertEqual(store[-1].choices, ["e", "f", "g", "h"])
+
+    def test_missing_last_correct_is_none(self):
+        quiz_dicts = make_dicts()
+        del quiz_dicts[1]["last_correct"]
+        self.assertIsNone(QuizStore.from_dicts(quiz_dicts)[1].last_correct)
+
+    def test_last_correct_setter(self):
+        store = QuizStore.from_dicts(make_dicts())
+        for value in (True, False, None):
+            store[0].last_correct = value
+            self.assertIs(store[0].last_correct, value)
+            self.assertIs(store.to_dicts()[0]["last_correct"], value)
+
+    def test_append_matches_from_dicts(self):
+        store = QuizStore()
+        for q_data in make_dicts():
+            store.append(Quiz(q_data["question"], q_data["choices"], q_data["answer"],
+                              q_data["last_correct"]))
+        self.assertEqual(store.to_dicts(), make_dicts())
+
+    def test_invalid_values_raise(self):
+        cases = [
+            ("answer", "2"),
+            ("answer", 200),
+            ("answer", True),
+            ("last_correct", 1),
+            ("question", 3),
+        ]
+        for key, value in cases:
+            quiz_dicts = make_dicts()
+            quiz_dicts[2][key] = value
+            with self.assertRaises(QuizStoreError) as ctx:
+                QuizStore.from_dicts(quiz_dicts)
+            self.assertEqual(ctx.exception.number, 3)
+        with self.assertRaises(QuizStoreError):
+            QuizStore().add("문제", ["a", "b", "c", "d"], 1000)
+
+
+class CompactLoadTest(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.work_dir.cleanup)
+        self.state_file = os.path.join(self.work_dir.name, "state.json")
+
+    def write_state(self, quiz_dicts):
+        data = {"quizzes": quiz_dicts, "best_score": 2, "game_history": []}
+        with open(self.state_file, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    def load(self, compact):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return QuizGame(compact=compact, state_file=self.state_file)
+
+    def test_compact_and_list_mode_save_the_same_data(self):
+        self.write_state(make_dicts())
+        compact = self.load(compact=True).build_state_data()
+        normal = self.load(compact=False).build_state_data()
+        self.assertEqual(compact, normal)
+        self.assertEqual(compact["quizzes"], make_dicts())
+
+    def test_unstorable_bank_is_not_replaced_by_defaults(self):
+        quiz_dicts = make_dicts()
+        quiz_dicts[1]["answer"] = "2"
+        self.write_state(quiz_dicts)
+        with open(self.state_file, "rb") as f:
+            before = f.read()
+
+        with self.assertRaises(QuizStoreError):
+            self.load(compact=True)
+        with open(self.state_file, "rb") as f:
+            self.assertEqual(f.read(), before)
+
+        # 일반 모드는 그대로 불러옵니다.
+        self.assertEqual(len(self.load(compact=False).quizzes), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
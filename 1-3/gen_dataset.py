@@ -0,0 +1,302 @@
+"""
+Mini NPU Dataset Generator
+generate_cross_pattern / generate_x_pattern과 같은 모양(shape_indices) 기반 대규모 합성 데이터셋 생성기
+모드 2(data.json 분석)와 채점 서버의 처리량·메모리 회귀를 같은 입력으로 측정하기 위한 도구
+외부 라이브러리 사용 금지 - 표준 라이브러리만 사용
+
+특징
+  - 패턴을 하나씩 만들어 바로 파일에 씀 (전체 데이터셋을 메모리에 올리지 않음)
+  - 같은 --seed면 항상 같은 파일 생성
+  - noise   : 모든 칸을 확률 p로 뒤집음 (0↔1)
+  - density : 배경 칸을 확률 p로 1로 채움 (잡음 점)
+  - aliases : expected/필터 라벨을 '+', 'cross', 'x' 등 여러 표기로 섞음
+  - tie-rate: Cross·X 점수가 같은 패턴을 일정 비율로 섞음 (UNDECIDED 경로 점검용)
+
+출력 형식 (--format, 생략 시 --out 확장자로 결정)
+  json  : data.json과 같은 스키마 {"filters": {...}, "patterns": {"size_5_1": {...}}}
+  jsonl : 첫 줄 {"filters": {...}}, 이후 한 줄에 패턴 하나 {"id", "input", "expected"}
+  bin   : 헤더 + 레코드 (칸 값은 비트 단위로 압축, 라벨은 표준 라벨 코드로 저장)
+          헤더   <4sHI  : b"NPUD", 버전, 패턴 수
+          필터부 <H     : 필터 수, 이후 필터마다 <HB (N, 라벨 코드) + 비트
+          패턴부         : 패턴마다 <HBB (N, 라벨 코드, 플래그(bit0=동점)) + 비트
+          비트           : N² 칸을 행 우선 MSB부터 채운 ceil(N²/8) 바이트
+
+실행 예시
+  python gen_dataset.py --sizes 5,13,25 --count 1000000 --noise 0.02 --out big.jsonl
+  python gen_dataset.py --count 100 --tie-rate 0.1 --seed 7 --out small.json
+  python main.py small.json   # 모드 2로 생성한 파일 분석
+"""
+
+import argparse
+import json
+import math
+import random
+import struct
+import sys
+
+from main import SHAPES, normalize_label, shape_indices
+
+# ============================================================
+# 상수 정의
+# ============================================================
+DEFAULT_SIZES = "5,13,25"
+DEFAULT_CROSS_ALIASES = "+,cross,Cross"
+DEFAULT_X_ALIASES = "x,X"
+DEFAULT_SEED = 42
+FORMATS = ("json", "jsonl", "bin")
+
+BIN_MAGIC = b"NPUD"
+BIN_VERSION = 1
+BIN_HEADER = struct.Struct("<4sHI")
+BIN_FILTER_COUNT = struct.Struct("<H")
+BIN_FILTER = struct.Struct("<HB")
+BIN_PATTERN = struct.Struct("<HBB")
+LABEL_CODES = {"Cross": 0, "X": 1}
+FLAG_TIE = 0x01
+
+
+# ============================================================
+# 패턴 생성
+# ============================================================
+def bernoulli_indices(rng: random.Random, p: float, total: int):
+    """
+    0..total-1 중 각 인덱스를 확률 p로 고른 결과를 순서대로 생성
+    칸마다 난수를 뽑지 않고 기하 분포로 다음 위치까지 건너뜀: O(선택된 칸 수)
+    """
+    if p <= 0:
+        return
+    if p >= 1:
+        yield from range(total)
+        return
+    log_q = math.log(1.0 - p)
+    k = -1
+    while True:
+        k += int(math.log(1.0 - rng.random()) / log_q) + 1
+        if k >= total:
+            return
+        yield k
+
+
+def base_values(shape: str, n: int) -> list:
+    """생성기 패턴의 0/1 정수 버퍼 (행 우선, 길이 N²)"""
+    values = [0] * (n * n)
+    for k in shape_indices(shape, n):
+        values[k] = 1
+    return values
+
+
+def tie_values(n: int) -> list:
+    """
+    Cross 점수와 X 점수가 같아지는 0/1 버퍼
+    Cross ∪ X 칸을 1로 채우면 홀수 N은 두 점수가 모두 2N-1로 같고,
+    짝수 N은 X가 한 칸 많으므로 X에만 속한 칸 하나를 0으로 되돌린다
+    """
+    values = [0] * (n * n)
+    cross = set(shape_indices("Cross", n))
+    x_only = [k for k in shape_indices("X", n) if k not in cross]
+    for k in cross:
+        values[k] = 1
+    for k in x_only:
+        values[k] = 1
+    if n % 2 == 0:
+        values[x_only[0]] = 0
+    return values
+
+
+def generate_patterns(rng: random.Random, sizes: list, count: int, noise: float,
+                      density: float, tie_rate: float, aliases: dict):
+    """
+    (키, N, 표준 라벨, 표기 라벨, 동점 여부, 버퍼)를 하나씩 생성 (스트리밍)
+    키는 모드 2 규칙대로 size_{N}_{번호}
+    """
+    for n in sizes:
+        bases = {shape: base_values(shape, n) for shape in SHAPES}
+        tie_base = tie_values(n)
+        total = n * n
+        for idx in range(1, count + 1):
+            label = SHAPES[rng.randrange(len(SHAPES))]
+            alias = rng.choice(aliases[label])
+            if rng.random() < tie_rate:
+                # 동점 패턴은 잡음을 넣으면 동점이 깨지므로 그대로 사용
+                yield f"size_{n}_{idx}", n, label, alias, True, tie_base
+                continue
+
+            values = bases[label][:]
+            for k in bernoulli_indices(rng, density, total):
+                values[k] = 1
+            for k in bernoulli_indices(rng, noise, total):
+                values[k] ^= 1
+            yield f"size_{n}_{idx}", n, label, alias, False, values
+
+
+def to_rows(values: list, n: int) -> list:
+    """1차원 버퍼 → 2차원 리스트 (JSON 출력용)"""
+    return [values[i * n:(i + 1) * n] for i in range(n)]
+
+
+def pack_bits(values: list) -> bytes:
+    """0/1 버퍼를 행 우선 MSB부터 비트로 압축"""
+    nbytes = (len(values) + 7) // 8
+    bits = "".join("1" if v else "0" for v in values)
+    bits += "0" * (nbytes * 8 - len(values))
+    return int(bits, 2).to_bytes(nbytes, "big")
+
+
+def unpack_bits(data: bytes, total: int) -> list:
+    """pack_bits의 역변환"""
+    bits = bin(int.from_bytes(data, "big"))[2:].zfill(len(data) * 8)
+    return [int(b) for b in bits[:total]]
+
+
+def build_filters(rng: random.Random, sizes: list, aliases: dict) -> dict:
+    """크기별 Cross/X 필터 (라벨 키도 표기를 섞어 정규화 경로를 점검)"""
+    filters = {}
+    for n in sizes:
+        filters[f"size_{n}"] = {
+            rng.choice(aliases[shape]): to_rows(base_values(shape, n), n) for shape in SHAPES
+        }
+    return filters
+
+
+# ============================================================
+# 출력 형식별 쓰기
+# ============================================================
+def write_json(out, filters: dict, patterns):
+    """data.json 스키마로 스트리밍 출력"""
+    out.write('{\n  "filters": ')
+    out.write(json.dumps(filters, separators=(",", ":")))
+    out.write(',\n  "patterns": {\n')
+    first = True
+    for key, n, label, alias, tie, values in patterns:
+        record = {"input": to_rows(values, n), "expected": alias}
+        if tie:
+            record["tie"] = True
+        if not first:
+            out.write(",\n")
+        out.write(f'    "{key}": ')
+        out.write(json.dumps(record, separators=(",", ":")))
+        first = False
+    out.write("\n  }\n}\n")
+
+
+def write_jsonl(out, filters: dict, patterns):
+    """첫 줄은 필터, 이후 한 줄에 패턴 하나"""
+    out.write(json.dumps({"filters": filters}, separators=(",", ":")) + "\n")
+    for key, n, label, alias, tie, values in patterns:
+        record = {"id": key, "input": to_rows(values, n), "expected": alias}
+        if tie:
+            record["tie"] = True
+        out.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+
+def write_bin(out, filters: dict, patterns, pattern_count: int):
+    """헤더 + 필터 + 패턴 레코드를 바이너리로 출력"""
+    out.write(BIN_HEADER.pack(BIN_MAGIC, BIN_VERSION, pattern_count))
+
+    filter_records = []
+    for size_key, filter_dict in filters.items():
+        n = int(size_key.split("_")[1])
+        for label, rows in filter_dict.items():
+            values = [v for row in rows for v in row]
+            filter_records.append(BIN_FILTER.pack(n, LABEL_CODES[normalize_label(label)])
+                                  + pack_bits(values))
+    out.write(BIN_FILTER_COUNT.pack(len(filter_records)))
+    for record in filter_records:
+        out.write(record)
+
+    for key, n, label, alias, tie, values in patterns:
+        flags = FLAG_TIE if tie else 0
+        out.write(BIN_PATTERN.pack(n, LABEL_CODES[label], flags))
+        out.write(pack_bits(values))
+
+
+def read_bin(path: str):
+    """
+    write_bin으로 만든 파일을 읽어 (필터 리스트, 패턴 제너레이터) 반환
+    필터: [(N, 표준 라벨, 버퍼)], 패턴: (N, 표준 라벨, 동점 여부, 버퍼)를 하나씩 생성
+    """
+    labels = {code: label for label, code in LABEL_CODES.items()}
+    f = open(path, "rb")
+    magic, version, count = BIN_HEADER.unpack(f.read(BIN_HEADER.size))
+    if magic != BIN_MAGIC or version != BIN_VERSION:
+        f.close()
+        raise ValueError(f"지원하지 않는 파일 형식: {magic!r} v{version}")
+
+    filters = []
+    (filter_count,) = BIN_FILTER_COUNT.unpack(f.read(BIN_FILTER_COUNT.size))
+    for _ in range(filter_count):
+        n, code = BIN_FILTER.unpack(f.read(BIN_FILTER.size))
+        filters.append((n, labels[code], unpack_bits(f.read((n * n + 7) // 8), n * n)))
+
+    def patterns():
+        with f:
+            for _ in range(count):
+                n, code, flags = BIN_PATTERN.unpack(f.read(BIN_PATTERN.size))
+                values = unpack_bits(f.read((n * n + 7) // 8), n * n)
+                yield n, labels[code], bool(flags & FLAG_TIE), values
+
+    return filters, patterns()
+
+
+# ============================================================
+# 메인 진입점
+# ============================================================
+def parse_aliases(text: str, expected: str) -> list:
+    """쉼표로 구분한 라벨 표기 목록 (모두 expected로 정규화되어야 함)"""
+    aliases = [a.strip() for a in text.split(",") if a.strip()]
+    for alias in aliases:
+        if normalize_label(alias) != expected:
+            raise SystemExit(f"  오류: 라벨 '{alias}'은(는) '{expected}'(으)로 정규화되지 않습니다.")
+    if not aliases:
+        raise SystemExit(f"  오류: '{expected}' 라벨 표기가 비어 있습니다.")
+    return aliases
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mini NPU 합성 데이터셋 생성기")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="쉼표로 구분한 N 목록")
+    parser.add_argument("--count", type=int, default=1000, help="크기별 패턴 수")
+    parser.add_argument("--noise", type=float, default=0.0, help="칸을 뒤집을 확률")
+    parser.add_argument("--density", type=float, default=0.0, help="배경 칸을 1로 채울 확률")
+    parser.add_argument("--tie-rate", type=float, default=0.0, help="동점 패턴 비율")
+    parser.add_argument("--cross-aliases", default=DEFAULT_CROSS_ALIASES)
+    parser.add_argument("--x-aliases", default=DEFAULT_X_ALIASES)
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED)
+    parser.add_argument("--format", choices=FORMATS, default=None)
+    parser.add_argument("--out", default="-", help="출력 파일 (기본: 표준 출력, bin은 파일 필요)")
+    args = parser.parse_args()
+
+    sizes = [int(n) for n in args.sizes.split(",")]
+    aliases = {
+        "Cross": parse_aliases(args.cross_aliases, "Cross"),
+        "X": parse_aliases(args.x_aliases, "X"),
+    }
+
+    fmt = args.format
+    if fmt is None:
+        extension = args.out.rsplit(".", 1)[-1].lower()
+        fmt = extension if extension in FORMATS else "json"
+    if fmt == "bin" and args.out == "-":
+        raise SystemExit("  오류: bin 형식은 --out 파일 경로가 필요합니다.")
+
+    rng = random.Random(args.seed)
+    filters = build_filters(rng, sizes, aliases)
+    patterns = generate_patterns(rng, sizes, args.count, args.noise,
+                                 args.density, args.tie_rate, aliases)
+
+    if fmt == "bin":
+        with open(args.out, "wb") as out:
+            write_bin(out, filters, patterns, len(sizes) * args.count)
+    else:
+        writer = write_json if fmt == "json" else write_jsonl
+        if args.out == "-":
+            writer(sys.stdout, filters, patterns)
+        else:
+            with open(args.out, "w", encoding="utf-8", newline="\n") as out:
+                writer(out, filters, patterns)
+
+    print(f"  ✓ {len(sizes) * args.count}개 패턴 생성 ({fmt}, seed={args.seed})", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,14 @@
 """
 Mini NPU Simulator
 MAC(Multiply-Accumulate) 연산 기반 패턴 판별기
-외부 라이브러리 사용 금지 - 표준 라이브러리(json, time)만 사용
+외부 라이브러리 사용 금지 - 표준 라이브러리(json, time, functools, os, sys)만 사용
 """
 
+import functools
 import json
 import time
 import os
+import sys
 
 # ============================================================
 # 상수 정의
@@ -14,43 +16,188 @@ import os
 EPSILON = 1e-9          # 동점 판정 허용오차
 REPEAT_COUNT = 10       # 성능 측정 반복 횟수
 DATA_FILE = "data.json" # 데이터 파일 경로
+SHAPES = ("Cross", "X") # 생성기가 만드는 모양 (모양 설명자 값)
+
+
+# ============================================================
+# 패턴 데이터 오류
+# ============================================================
+class PatternError(ValueError):
+    """
+    패턴 데이터 형식 오류
+    row/col에 문제가 된 위치(없으면 None), reason에 원인을 담아
+    호출하는 쪽이 칸마다 예외 처리를 하지 않고 한 번에 보고할 수 있게 함
+    """
+
+    def __init__(self, reason: str, row: int = None, col: int = None):
+        self.reason = reason
+        self.row = row
+        self.col = col
+        if row is None:
+            where = ""
+        elif col is None:
+            where = f"{row}행: "
+        else:
+            where = f"({row}, {col}): "
+        super().__init__(where + reason)
+
+
+NUMERIC_TYPES = (int, float)  # 패턴 값으로 허용하는 타입 (bool·문자열은 거부)
+FLOAT_MAX = sys.float_info.max  # 이보다 큰 정수는 float로 바꿀 수 없으므로 거부
+INT_EXACT_MAX = 2 ** 53         # 이 크기까지의 정수만 그대로 저장 (float로 정확히 표현되는 범위)
 
 
 # ============================================================
 # Pattern 클래스: N×N 2차원 배열 저장/읽기
 # ============================================================
 class Pattern:
-    """N×N 크기의 2차원 패턴 또는 필터를 저장하는 클래스"""
+    """
+    N×N 크기의 2차원 패턴 또는 필터를 저장하는 클래스
+    값은 길이 N²의 1차원 버퍼에 행 우선으로 저장: (row, col) → row * N + col
+    """
 
-    def __init__(self, n: int):
+    def __init__(self, n: int, shape: str = None, values: list = None):
         self.n = n
-        self.data = [[0.0] * n for _ in range(n)]
+        # 생성기로 만든 패턴이면 모양 설명자('Cross' 또는 'X'), 아니면 None
+        # 설명자가 있으면 버퍼를 보관하지 않음 (캐시로 공유되는 객체에 N² 배열을 남기지 않도록)
+        self.shape = shape
+        if values is not None:
+            self._values = values
+        elif shape is None:
+            self._values = [0.0] * (n * n)
+        else:
+            self._values = None
+
+    @property
+    def values(self) -> list:
+        """
+        길이 N²의 1차원 버퍼
+        모양 패턴은 읽을 때마다 새 버퍼를 만들어 반환 (보관하지 않으므로 고쳐도 패턴은 그대로)
+        """
+        if self._values is None:
+            buffer = [0.0] * (self.n * self.n)
+            for k in shape_indices(self.shape, self.n):
+                buffer[k] = 1.0
+            return buffer
+        return self._values
 
     def set_value(self, row: int, col: int, value: float):
         """특정 위치에 값 저장"""
-        self.data[row][col] = value
+        if self.shape is not None:
+            raise ValueError(f"생성기 패턴({self.shape})은 공유되므로 수정할 수 없음")
+        self.values[row * self.n + col] = value
 
     def get_value(self, row: int, col: int) -> float:
-        """특정 위치의 값 읽기"""
-        return self.data[row][col]
+        """특정 위치의 값 읽기 (모양 패턴은 버퍼 없이 좌표로 판단)"""
+        if self._values is None:
+            return 1.0 if shape_contains(self.shape, self.n, row, col) else 0.0
+        return self._values[row * self.n + col]
 
     @classmethod
     def from_2d_list(cls, array_2d: list) -> "Pattern":
-        """2차원 리스트로부터 Pattern 객체 생성"""
+        """
+        2차원 리스트로부터 Pattern 객체 생성
+        한 번의 순회로 모양(N×N)과 숫자 타입을 검증하면서 1차원 버퍼를 바로 구성
+        ±2**53 이내의 정수(0/1 포함)는 float로 변환하지 않고 그대로 저장
+        그보다 큰 정수는 float로 변환 (곱이 커져도 정수 곱셈 대신 float 연산이 되어 inf가 될 뿐 예외가 없음)
+        float 범위를 넘는 정수는 거부
+        형식이 잘못되면 PatternError (위치와 원인 포함)
+        """
+        if not isinstance(array_2d, (list, tuple)):
+            raise PatternError("2차원 리스트가 아님")
         n = len(array_2d)
-        p = cls(n)
-        for i in range(n):
-            for j in range(len(array_2d[i])):
-                p.set_value(i, j, float(array_2d[i][j]))
-        return p
+        if n == 0:
+            raise PatternError("빈 패턴")
+
+        values = []
+        for i, row in enumerate(array_2d):
+            if not isinstance(row, (list, tuple)):
+                raise PatternError("행이 리스트가 아님", i)
+            if len(row) != n:
+                raise PatternError(f"행 길이 {len(row)} ≠ {n} (N×N이 아님)", i)
+            # 행마다 값 타입 집합만 확인 (대부분 int 또는 float 한 가지)
+            kinds = set(map(type, row))
+            if not kinds.issubset(NUMERIC_TYPES):
+                for j, v in enumerate(row):
+                    if type(v) not in NUMERIC_TYPES:
+                        raise PatternError(f"숫자가 아닌 값 {v!r}", i, j)
+            # 정수가 있는 행만 최댓값/최솟값으로 범위를 한 번에 확인
+            if int in kinds and (max(row) > INT_EXACT_MAX or min(row) < -INT_EXACT_MAX):
+                row = list(row)  # 입력 리스트는 고치지 않음
+                for j, v in enumerate(row):
+                    if type(v) is int and abs(v) > INT_EXACT_MAX:
+                        if abs(v) > FLOAT_MAX:
+                            raise PatternError("float로 표현할 수 없는 큰 정수", i, j)
+                        row[j] = float(v)
+            values.extend(row)
+        return cls(n, values=values)
 
     def __repr__(self):
+        n = self.n
+        values = self.values
         lines = []
-        for row in self.data:
+        for i in range(n):
+            row = values[i * n:(i + 1) * n]
             lines.append("  " + " ".join(f"{v:.0f}" for v in row))
         return "\n".join(lines)
 
 
+# ============================================================
+# 모양 설명자: 생성기 패턴의 1.0 칸 좌표와 닫힌 식 점수
+# ============================================================
+@functools.lru_cache(maxsize=64)
+def shape_indices(shape: str, n: int) -> tuple:
+    """
+    모양 패턴에서 값이 1.0인 칸의 버퍼 인덱스(row * N + col)를 행 우선 순서로 반환 (중복 없음)
+    행 우선 순서이므로 이 칸들만 더해도 전체 MAC과 덧셈 순서가 같다
+    """
+    mid = n // 2
+    indices = []
+    for i in range(n):
+        if shape == "Cross":
+            if i == mid:
+                indices.extend(range(i * n, (i + 1) * n))
+            else:
+                indices.append(i * n + mid)
+        elif shape == "X":
+            indices.append(i * n + min(i, n - 1 - i))
+            if i != n - 1 - i:
+                indices.append(i * n + max(i, n - 1 - i))
+        else:
+            raise ValueError(f"알 수 없는 모양: {shape}")
+    return tuple(indices)
+
+
+def shape_contains(shape: str, n: int, row: int, col: int) -> bool:
+    """(row, col)이 모양 패턴의 1.0 칸인지 (shape_indices와 같은 칸): O(1)"""
+    if not (0 <= row < n and 0 <= col < n):
+        raise IndexError(f"({row}, {col})이 {n}×{n} 범위를 벗어남")
+    if shape == "Cross":
+        return row == n // 2 or col == n // 2
+    if shape == "X":
+        return col == row or col == n - 1 - row
+    raise ValueError(f"알 수 없는 모양: {shape}")
+
+
+def shape_overlap(shape_a: str, shape_b: str, n: int) -> float:
+    """
+    같은 크기 N의 두 모양 패턴 사이 MAC 점수(겹치는 칸 수)를 닫힌 식으로 계산: O(1)
+      Cross·Cross = 2N-1                 (가운데 행 N칸 + 가운데 열 N칸 - 교차점)
+      X·X         = 2N (짝수), 2N-1 (홀수) (두 대각선, 홀수면 중심 공유)
+      Cross·X     = 1 (홀수: 중심), 3 (짝수: 중심 주변 세 칸)
+    N ≤ 0이면 겹치는 칸이 없으므로 0
+    """
+    if n <= 0:
+        return 0.0
+    if shape_a == shape_b == "Cross":
+        return float(2 * n - 1)
+    if shape_a == shape_b == "X":
+        return float(2 * n - n % 2)
+    if {shape_a, shape_b} == {"Cross", "X"}:
+        return 1.0 if n % 2 == 1 else 3.0
+    raise ValueError(f"알 수 없는 모양 조합: {shape_a}, {shape_b}")
+
+
 # ============================================================
 # 라벨 정규화 (표준화)
 # ============================================================
@@ -76,16 +223,74 @@ def mac_compute(pattern: Pattern, filter_p: Pattern) -> float:
     """
     MAC(Multiply-Accumulate) 연산
     입력 패턴과 필터를 위치별로 곱하고 모두 더해 점수를 반환
+    모양 설명자가 있는 피연산자는 빠른 경로 사용
+      둘 다 모양 패턴  → 닫힌 식 O(1)
+      한쪽만 모양 패턴 → 그 모양의 1.0 칸만 더함 O(nnz)
+      그 외            → 전체 칸 순회 O(N²)
+    크기(N)가 다르면 ValueError
+    """
+    if pattern.n != filter_p.n:
+        raise ValueError(f"크기 불일치: 패턴 {pattern.n}×{pattern.n} vs 필터 {filter_p.n}×{filter_p.n}")
+    if pattern.shape is not None and filter_p.shape is not None:
+        return shape_overlap(pattern.shape, filter_p.shape, pattern.n)
+    if filter_p.shape is not None:
+        return mac_compute_cells(pattern, shape_indices(filter_p.shape, filter_p.n))
+    if pattern.shape is not None:
+        return mac_compute_cells(filter_p, shape_indices(pattern.shape, pattern.n))
+    return mac_compute_dense(pattern, filter_p)
+
+
+def mac_compute_dense(pattern: Pattern, filter_p: Pattern) -> float:
+    """
+    모든 칸을 곱하고 더하는 기본 MAC 연산
     시간 복잡도: O(N²)
     """
-    n = pattern.n
+    a = pattern.values
+    b = filter_p.values
     score = 0.0
-    for i in range(n):
-        for j in range(n):
-            score += pattern.get_value(i, j) * filter_p.get_value(i, j)
+    for k in range(pattern.n * pattern.n):
+        score += a[k] * b[k]
+    return score
+
+
+def mac_compute_cells(pattern: Pattern, indices: tuple) -> float:
+    """상대 모양 패턴의 1.0 칸 인덱스(indices)에 있는 값만 더함: O(nnz)"""
+    values = pattern.values
+    score = 0.0
+    for k in indices:
+        score += values[k]
     return score
 
 
+def mac_compute_batch(patterns: list, filter_p: Pattern) -> list:
+    """
+    여러 패턴을 같은 필터와 한 번에 MAC 연산 (서버 마이크로 배치용)
+    필터에서 0이 아닌 칸만 한 번 뽑아 두고 모든 패턴에 재사용
+    (0인 칸은 곱해도 0이므로 점수는 mac_compute와 같다)
+    시간 복잡도: O(패턴 수 × 필터의 0이 아닌 칸 수)
+    크기(N)가 필터와 다른 패턴이 있으면 ValueError
+    """
+    if filter_p.shape is not None:
+        cells = [(k, 1.0) for k in shape_indices(filter_p.shape, filter_p.n)]
+    else:
+        cells = [(k, weight) for k, weight in enumerate(filter_p.values) if weight != 0]
+
+    scores = []
+    for pattern in patterns:
+        if pattern.n != filter_p.n:
+            raise ValueError(f"크기 불일치: 패턴 {pattern.n}×{pattern.n} vs 필터 {filter_p.n}×{filter_p.n}")
+        # 모양 패턴은 배열을 만들지 않고 빠른 경로로 계산
+        if pattern.shape is not None:
+            scores.append(mac_compute(pattern, filter_p))
+            continue
+        values = pattern.values
+        score = 0.0
+        for k, weight in cells:
+            score += values[k] * weight
+        scores.append(score)
+    return scores
+
+
 # ============================================================
 # 점수 비교 → 판정
 # ============================================================
@@ -149,33 +354,38 @@ def measure_mac_time(pattern: Pattern, filter_p: Pattern,
     """
     MAC 연산을 repeat회 반복 측정하여 평균 시간(ms)을 반환
     I/O 시간 제외, 연산 함수 호출 구간만 측정
+    모양 패턴의 O(1) 빠른 경로가 아닌 O(N²) 전체 순회 비용을 측정
     """
     total = 0.0
     for _ in range(repeat):
         start = time.perf_counter()
-        mac_compute(pattern, filter_p)
+        mac_compute_dense(pattern, filter_p)
         end = time.perf_counter()
         total += (end - start) * 1000  # 초 → ms
     return total / repeat
 
 
+@functools.lru_cache(maxsize=64)
+def generate_shape_pattern(shape: str, n: int) -> Pattern:
+    """
+    (모양, N)별로 캐시되는 모양 패턴 생성
+    같은 객체를 여러 곳에서 공유하므로 읽기 전용 (set_value 불가)
+    """
+    if shape not in SHAPES:
+        raise ValueError(f"알 수 없는 모양: {shape}")
+    if n < 1:
+        raise ValueError(f"패턴 크기는 1 이상이어야 함: {n}")
+    return Pattern(n, shape)
+
+
 def generate_cross_pattern(n: int) -> Pattern:
     """N×N 십자가(Cross) 패턴을 자동 생성 (보너스: 패턴 생성기)"""
-    p = Pattern(n)
-    mid = n // 2
-    for i in range(n):
-        p.set_value(mid, i, 1.0)
-        p.set_value(i, mid, 1.0)
-    return p
+    return generate_shape_pattern("Cross", n)
 
 
 def generate_x_pattern(n: int) -> Pattern:
     """N×N X 패턴을 자동 생성 (보너스: 패턴 생성기)"""
-    p = Pattern(n)
-    for i in range(n):
-        p.set_value(i, i, 1.0)
-        p.set_value(i, n - 1 - i, 1.0)
-    return p
+    return generate_shape_pattern("X", n)
 
 
 def performance_analysis(sizes: list):
@@ -189,9 +399,10 @@ def performance_analysis(sizes: list):
     print(f"{'크기':<10} {'평균 시간(ms)':>14} {'연산 횟수(N²)':>14}")
     print("-" * 43)
     for n in sizes:
-        pattern = generate_cross_pattern(n)
-        filt = generate_cross_pattern(n)
-        avg_ms = measure_mac_time(pattern, filt, REPEAT_COUNT)
+        # 캐시된 생성기 패턴에서 측정용 N² 배열을 복사해 쓰고 버림 (캐시에 배열을 남기지 않음)
+        dense = Pattern(n, values=generate_cross_pattern(n).values)
+        avg_ms = measure_mac_time(dense, dense, REPEAT_COUNT)
+        del dense
         ops = n * n
         print(f"{str(n) + '×' + str(n):<10} {avg_ms:>14.4f} {ops:>14}")
 
@@ -264,21 +475,25 @@ def load_filters(data: dict) -> dict:
         normalized = {}
         for label, arr in filter_dict.items():
             std_label = normalize_label(label)
-            normalized[std_label] = Pattern.from_2d_list(arr)
+            try:
+                normalized[std_label] = Pattern.from_2d_list(arr)
+            except PatternError as e:
+                print(f"  ✗ {size_key:<8} 필터 '{label}' 형식 오류: {e}")
         filters[size_key] = normalized
         loaded_labels = ", ".join(normalized.keys())
         print(f"  ✓ {size_key:<8} 필터 로드 완료 ({loaded_labels})")
     return filters
 
 
-def mode2_json_analysis():
+def mode2_json_analysis(data_path: str = None):
     """
-    data.json을 로드하여 각 패턴을 판별하고
+    data.json(또는 data_path로 지정한 파일)을 로드하여 각 패턴을 판별하고
     PASS/FAIL을 출력하는 모드
     """
-    # 파일 경로 결정 (main.py와 같은 디렉토리 우선)
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    data_path = os.path.join(script_dir, DATA_FILE)
+    # 파일 경로 결정 (지정하지 않으면 main.py와 같은 디렉토리의 data.json)
+    if data_path is None:
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        data_path = os.path.join(script_dir, DATA_FILE)
 
     if not os.path.exists(data_path):
         print(f"  오류: '{data_path}' 파일을 찾을 수 없습니다.")
@@ -334,21 +549,23 @@ def mode2_json_analysis():
             fail_cases.append((pat_key, reason))
             continue
 
-        # 패턴 로드
+        # 패턴 로드 (모양·타입 오류는 PatternError 하나로 보고)
         try:
-            input_arr = pat_info["input"]
-            pattern = Pattern.from_2d_list(input_arr)
-        except (KeyError, TypeError, ValueError) as e:
+            if not isinstance(pat_info, dict) or "input" not in pat_info:
+                raise PatternError("'input' 항목 없음")
+            pattern = Pattern.from_2d_list(pat_info["input"])
+        except PatternError as e:
             reason = f"패턴 데이터 오류: {e}"
             print(f"  FAIL: {reason}")
             failed += 1
             fail_cases.append((pat_key, reason))
             continue
 
-        # 크기 일치 검증
-        if pattern.n != cross_filter.n:
+        # 크기 일치 검증 (Cross·X 필터 모두)
+        mismatched = [f for f in (cross_filter, x_filter) if f.n != pattern.n]
+        if mismatched:
             reason = (f"크기 불일치: 패턴 {pattern.n}×{pattern.n} vs "
-                      f"필터 {cross_filter.n}×{cross_filter.n}")
+                      f"필터 {mismatched[0].n}×{mismatched[0].n}")
             print(f"  FAIL: {reason}")
             failed += 1
             fail_cases.append((pat_key, reason))
@@ -417,6 +634,9 @@ def mode2_json_analysis():
 # 메인 진입점
 # ============================================================
 def main():
+    # 명령행 인자로 데이터 파일을 주면 모드 2에서 그 파일을 분석 (예: 생성기 출력)
+    data_path = sys.argv[1] if len(sys.argv) > 1 else None
+
     print("=" * 43)
     print("  Mini NPU Simulator")
     print("  MAC 연산 기반 패턴 판별기")
@@ -432,7 +652,7 @@ def main():
             mode1_user_input()
             break
         elif choice == "2":
-            mode2_json_analysis()
+            mode2_json_analysis(data_path)
             break
         else:
             print("  1 또는 2를 입력하세요.")
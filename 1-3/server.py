@@ -0,0 +1,333 @@
+"""
+Mini NPU Scoring Server
+필터를 한 번만 로드해 두고 HTTP로 패턴 판별 요청을 받는 로컬 서비스
+짧은 시간(수 ms) 안에 들어온 요청을 마이크로 배치로 묶어 한꺼번에 MAC 연산
+외부 라이브러리 사용 금지 - 표준 라이브러리만 사용
+
+API
+  POST /score   요청: {"pattern": [[...], ...]} 또는 {"patterns": [[[...]], ...]}
+                응답: {"results": [{"size": "size_5", "cross": 5.0, "x": 1.0,
+                                    "verdict": "Cross"}, ...]}
+  GET  /stats   처리량·지연 시간·배치 크기 통계
+
+실행
+  python server.py --port 8080
+  curl -s -X POST localhost:8080/score -d '{"pattern": [[0,1,0],[1,1,1],[0,1,0]]}'
+"""
+
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from main import (DATA_FILE, EPSILON, Pattern, PatternError, judge, load_filters,
+                  mac_compute_batch)
+
+# ============================================================
+# 상수 정의
+# ============================================================
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+BATCH_WINDOW_MS = 2.0     # 첫 요청 이후 배치에 더 모으는 시간 (ms)
+MAX_BATCH_SIZE = 512      # 배치 하나에 담는 최대 패턴 수
+LATENCY_SAMPLES = 10000   # 지연 시간 백분위 계산에 쓰는 최근 표본 수
+REQUEST_TIMEOUT = 30.0    # 채점 결과를 기다리는 최대 시간 (초)
+
+
+class ScoringError(Exception):
+    """요청 하나를 채점할 수 없을 때 (형식 오류, 필터 없음 등)"""
+
+
+# ============================================================
+# 통계: 처리량·지연 시간·배치 크기
+# ============================================================
+class ScoringStats:
+    """여러 스레드에서 갱신하는 서버 통계"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.requests = 0
+        self.patterns = 0
+        self.errors = 0
+        self.scored = 0
+        self.batches = 0
+        self.max_batch = 0
+        self.latencies_ms = deque(maxlen=LATENCY_SAMPLES)
+
+    def record_request(self, pattern_count: int):
+        with self.lock:
+            self.requests += 1
+            self.patterns += pattern_count
+
+    def record_error(self):
+        with self.lock:
+            self.errors += 1
+
+    def record_batch(self, batch_size: int, latencies_ms: list):
+        with self.lock:
+            self.batches += 1
+            self.scored += batch_size
+            self.max_batch = max(self.max_batch, batch_size)
+            self.latencies_ms.extend(latencies_ms)
+
+    def snapshot(self) -> dict:
+        """현재 통계를 JSON으로 보낼 수 있는 dict로 반환"""
+        with self.lock:
+            uptime = time.perf_counter() - self.started
+            latencies = sorted(self.latencies_ms)
+            scored = self.scored
+            return {
+                "uptime_s": round(uptime, 3),
+                "requests": self.requests,
+                "patterns": self.patterns,
+                "errors": self.errors,
+                "scored": scored,
+                "batches": self.batches,
+                "avg_batch_size": round(scored / self.batches, 3) if self.batches else 0.0,
+                "max_batch_size": self.max_batch,
+                "throughput_pps": round(scored / uptime, 3) if uptime > 0 else 0.0,
+                "latency_ms": {
+                    "p50": percentile(latencies, 0.50),
+                    "p95": percentile(latencies, 0.95),
+                    "p99": percentile(latencies, 0.99),
+                    "max": round(latencies[-1], 4) if latencies else 0.0,
+                },
+            }
+
+
+def percentile(sorted_values: list, ratio: float) -> float:
+    """정렬된 리스트에서 백분위 값 (표본이 없으면 0)"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(ratio * len(sorted_values)))
+    return round(sorted_values[index], 4)
+
+
+# ============================================================
+# 마이크로 배처: 요청을 모아 필터 뱅크와 한꺼번에 연산
+# ============================================================
+class MicroBatcher:
+    """
+    submit()으로 들어온 패턴을 큐에 쌓고, 작업 스레드가
+    window_ms 동안(또는 max_batch개가 찰 때까지) 모아서 한 번에 채점
+    """
+
+    def __init__(self, filters: dict, stats: ScoringStats,
+                 window_ms: float = BATCH_WINDOW_MS, max_batch: int = MAX_BATCH_SIZE):
+        self.filters = filters
+        self.stats = stats
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        self.queue = queue.Queue()
+        self.worker = threading.Thread(target=self.run, daemon=True)
+        self.worker.start()
+
+    def submit(self, pattern: Pattern) -> Future:
+        """패턴 하나를 배치 큐에 넣고, 결과를 받을 Future를 반환"""
+        future = Future()
+        self.queue.put((pattern, future, time.perf_counter()))
+        return future
+
+    def run(self):
+        while True:
+            batch = [self.queue.get()]
+            deadline = time.perf_counter() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self.score_batch(batch)
+
+    def score_batch(self, batch: list):
+        """배치를 크기별로 나눈 뒤 크기마다 Cross/X 필터와 한 번에 MAC 연산"""
+        groups = {}
+        for item in batch:
+            size_key = f"size_{item[0].n}"
+            groups.setdefault(size_key, []).append(item)
+
+        latencies = []
+        for size_key, items in groups.items():
+            bank = self.filters.get(size_key, {})
+            cross_filter = bank.get("Cross")
+            x_filter = bank.get("X")
+            if cross_filter is None or x_filter is None:
+                for _, future, _ in items:
+                    future.set_exception(ScoringError(f"'{size_key}' Cross 또는 X 필터 없음"))
+                continue
+
+            # 배치 연산이 실패하면 같은 배치에 섞인 다른 요청까지 실패하지 않도록
+            # 패턴을 하나씩 다시 채점해, 예외를 일으킨 패턴에만 오류를 돌려준다
+            patterns = [pattern for pattern, _, _ in items]
+            try:
+                scores = list(zip(mac_compute_batch(patterns, cross_filter),
+                                  mac_compute_batch(patterns, x_filter)))
+            except Exception:
+                scores = [score_one(pattern, cross_filter, x_filter) for pattern in patterns]
+
+            done = time.perf_counter()
+            for (_, future, queued), score in zip(items, scores):
+                if isinstance(score, Exception):
+                    future.set_exception(ScoringError(f"'{size_key}' 채점 실패: {score!r}"))
+                    continue
+                cross_score, x_score = score
+                future.set_result({
+                    "size": size_key,
+                    "cross": cross_score,
+                    "x": x_score,
+                    "verdict": judge(cross_score, x_score, "Cross", "X"),
+                })
+                latencies.append((done - queued) * 1000)
+
+        self.stats.record_batch(len(latencies), latencies)
+
+
+def score_one(pattern: Pattern, cross_filter: Pattern, x_filter: Pattern):
+    """패턴 하나의 (Cross 점수, X 점수), 연산이 실패하면 그 예외 객체를 반환"""
+    try:
+        return (mac_compute_batch([pattern], cross_filter)[0],
+                mac_compute_batch([pattern], x_filter)[0])
+    except Exception as e:
+        return e
+
+
+# ============================================================
+# HTTP 핸들러
+# ============================================================
+class ScoringHandler(BaseHTTPRequestHandler):
+    """POST /score, GET /stats 처리 (server 속성으로 batcher/stats 접근)"""
+
+    def do_GET(self):
+        if self.path == "/stats":
+            self.send_json(200, self.server.stats.snapshot())
+        else:
+            self.send_json(404, {"error": f"알 수 없는 경로: {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/score":
+            self.send_json(404, {"error": f"알 수 없는 경로: {self.path}"})
+            return
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            body = json.loads(self.rfile.read(length).decode("utf-8"))
+            arrays = parse_score_request(body)
+        except (ValueError, ScoringError) as e:
+            self.server.stats.record_error()
+            self.send_json(400, {"error": f"요청 형식 오류: {e}"})
+            return
+
+        self.server.stats.record_request(len(arrays))
+
+        # 패턴마다 Pattern으로 변환해 배치 큐에 넣고, 결과를 순서대로 모은다
+        futures = []
+        for arr in arrays:
+            try:
+                futures.append(self.server.batcher.submit(Pattern.from_2d_list(arr)))
+            except PatternError as e:
+                futures.append(failed_future(ScoringError(f"패턴 데이터 오류: {e}")))
+
+        results = []
+        for future in futures:
+            try:
+                results.append(future.result(timeout=self.server.request_timeout))
+            except ScoringError as e:
+                self.server.stats.record_error()
+                results.append({"error": str(e)})
+            except FutureTimeoutError:
+                # 배처가 밀려 제시간에 결과를 못 받음 (남은 Future는 배처가 나중에 채움)
+                self.server.stats.record_error()
+                self.send_json(504, {"error": f"채점 시간 초과 ({self.server.request_timeout}초)"})
+                return
+        self.send_json(200, {"results": results, "epsilon": EPSILON})
+
+    def send_json(self, status: int, payload: dict):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        """요청마다 콘솔에 출력하지 않음 (통계는 /stats로 확인)"""
+
+
+def parse_score_request(body) -> list:
+    """요청 본문에서 2차원 배열 리스트를 꺼냄"""
+    if not isinstance(body, dict):
+        raise ScoringError("JSON 객체가 필요합니다")
+    if "pattern" in body:
+        return [body["pattern"]]
+    if "patterns" in body and isinstance(body["patterns"], list):
+        return body["patterns"]
+    raise ScoringError("'pattern' 또는 'patterns' 키가 필요합니다")
+
+
+def failed_future(error: Exception) -> Future:
+    """이미 실패한 Future (배치에 넣지 못한 패턴용)"""
+    future = Future()
+    future.set_exception(error)
+    return future
+
+
+class ScoringServer(ThreadingHTTPServer):
+    """필터·배처·통계를 한 번만 만들어 모든 요청이 공유하는 HTTP 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple, filters: dict,
+                 window_ms: float = BATCH_WINDOW_MS, max_batch: int = MAX_BATCH_SIZE,
+                 request_timeout: float = REQUEST_TIMEOUT):
+        super().__init__(address, ScoringHandler)
+        self.request_timeout = request_timeout
+        self.stats = ScoringStats()
+        self.batcher = MicroBatcher(filters, self.stats, window_ms, max_batch)
+
+
+# ============================================================
+# 메인 진입점
+# ============================================================
+def main():
+    parser = argparse.ArgumentParser(description="Mini NPU Scoring Server")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--data", default=None, help=f"필터를 읽을 파일 (기본: {DATA_FILE})")
+    parser.add_argument("--window-ms", type=float, default=BATCH_WINDOW_MS)
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH_SIZE)
+    parser.add_argument("--timeout", type=float, default=REQUEST_TIMEOUT,
+                        help="채점 결과를 기다리는 최대 시간 (초, 넘으면 504)")
+    args = parser.parse_args()
+
+    data_path = args.data
+    if data_path is None:
+        data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), DATA_FILE)
+    with open(data_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    filters = load_filters(data)
+    server = ScoringServer((args.host, args.port), filters, args.window_ms, args.max_batch,
+                           args.timeout)
+
+    print(f"\n  Scoring server: http://{args.host}:{args.port} "
+          f"(배치 {args.window_ms}ms / 최대 {args.max_batch}개)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n  서버 종료")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
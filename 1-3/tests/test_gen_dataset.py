@@ -0,0 +1,93 @@
+"""
+test_gen_dataset.py - 합성 데이터셋 생성기(gen_dataset.py)의 bin 형식 왕복 테스트
+
+    python -m unittest discover tests
+"""
+
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gen_dataset import (build_filters, generate_patterns, pack_bits, read_bin,  # noqa: E402
+                         unpack_bits, write_bin, write_jsonl)
+from main import normalize_label  # noqa: E402
+
+SIZES = [1, 3, 5, 13]  # N² = 1, 9, 25, 169: 8의 배수가 아닌 경우 포함
+ALIASES = {"Cross": ["+", "cross", "Cross"], "X": ["x", "X"]}
+
+
+def make_dataset(seed, count=40):
+    rng = random.Random(seed)
+    filters = build_filters(rng, SIZES, ALIASES)
+    patterns = list(generate_patterns(rng, SIZES, count, noise=0.1, density=0.05,
+                                      tie_rate=0.2, aliases=ALIASES))
+    return filters, patterns
+
+
+class BitPackingTest(unittest.TestCase):
+    def test_round_trip(self):
+        rng = random.Random(1)
+        for total in (1, 7, 8, 9, 25, 169):
+            for values in ([0] * total, [1] * total, [rng.randint(0, 1) for _ in range(total)]):
+                packed = pack_bits(values)
+                self.assertEqual(len(packed), (total + 7) // 8)
+                self.assertEqual(unpack_bits(packed, total), values)
+
+
+class BinFormatTest(unittest.TestCase):
+    def setUp(self):
+        self.work_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.work_dir.cleanup)
+        self.path = os.path.join(self.work_dir.name, "data.bin")
+
+    def write(self, filters, patterns):
+        with open(self.path, "wb") as out:
+            write_bin(out, filters, iter(patterns), len(patterns))
+
+    def test_round_trip(self):
+        filters, patterns = make_dataset(seed=7)
+        self.assertTrue(any(tie for _, _, _, _, tie, _ in patterns))
+        self.write(filters, patterns)
+
+        read_filters, read_patterns = read_bin(self.path)
+        expected_filters = []
+        for size_key, filter_dict in filters.items():
+            for label, rows in filter_dict.items():
+                expected_filters.append((int(size_key.split("_")[1]), normalize_label(label),
+                                         [v for row in rows for v in row]))
+        self.assertEqual(read_filters, expected_filters)
+
+        expected_patterns = [(n, label, tie, values) for _, n, label, _, tie, values in patterns]
+        self.assertEqual(list(read_patterns), expected_patterns)
+
+    def test_matches_jsonl_for_same_seed(self):
+        filters, patterns = make_dataset(seed=11)
+        self.write(filters, patterns)
+        _, read_patterns = read_bin(self.path)
+
+        out = io.StringIO()
+        write_jsonl(out, *make_dataset(seed=11))
+        lines = out.getvalue().splitlines()[1:]
+        self.assertEqual(len(lines), len(patterns))
+        for line, (n, label, tie, values) in zip(lines, list(read_patterns)):
+            record = json.loads(line)
+            self.assertEqual(len(record["input"]), n)
+            self.assertEqual([v for row in record["input"] for v in row], values)
+            self.assertEqual(normalize_label(record["expected"]), label)
+            self.assertEqual(record.get("tie", False), tie)
+
+    def test_rejects_unknown_format(self):
+        with open(self.path, "wb") as out:
+            out.write(b"NOPE" + bytes(6))
+        with self.assertRaises(ValueError):
+            read_bin(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+"""
+test_main.py - Pattern 생성·검증과 MAC 연산 경로 테스트
+
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import (SHAPES, Pattern, PatternError, generate_cross_pattern, generate_shape_pattern,  # noqa: E402
+                  generate_x_pattern, mac_compute, mac_compute_batch, mac_compute_dense,
+                  mode2_json_analysis, performance_analysis, shape_overlap)
+
+
+class FromListTest(unittest.TestCase):
+    def test_flat_buffer(self):
+        pattern = Pattern.from_2d_list([[0, 1], [2.5, 3]])
+        self.assertEqual(pattern.n, 2)
+        self.assertEqual(pattern.values, [0, 1, 2.5, 3])
+        self.assertEqual(pattern.get_value(1, 0), 2.5)
+
+    def test_invalid_values(self):
+        cases = [
+            ([[0, 1], [1]], (1, None)),
+            ([[0, 1], [1, "a"]], (1, 1)),
+            ([[0, True], [1, 0]], (0, 1)),
+        ]
+        for array_2d, (row, col) in cases:
+            with self.assertRaises(PatternError) as ctx:
+                Pattern.from_2d_list(array_2d)
+            self.assertEqual((ctx.exception.row, ctx.exception.col), (row, col))
+
+    def test_int_out_of_float_range(self):
+        for big in (10 ** 400, -10 ** 400):
+            array_2d = [[0] * 5 for _ in range(5)]
+            array_2d[3][2] = big
+            with self.assertRaises(PatternError) as ctx:
+                Pattern.from_2d_list(array_2d)
+            self.assertEqual((ctx.exception.row, ctx.exception.col), (3, 2))
+        # float 최댓값 이하의 큰 정수와 무한대 float는 허용
+        pattern = Pattern.from_2d_list([[10 ** 300, float("inf")], [0, 0]])
+        self.assertEqual(pattern.get_value(0, 0), float(10 ** 300))
+
+    def test_large_ints_become_floats(self):
+        exact = 2 ** 53
+        array_2d = [[exact, -exact], [exact + 1, -(exact + 1)]]
+        pattern = Pattern.from_2d_list(array_2d)
+        self.assertEqual([type(v) for v in pattern.values], [int, int, float, float])
+        self.assertEqual(array_2d[1][0], exact + 1)  # 입력 리스트는 그대로
+
+        # 곱이 float 범위를 넘어도 예외 없이 inf (정수 그대로였다면 OverflowError)
+        big = Pattern.from_2d_list([[10 ** 200]])
+        self.assertEqual(mac_compute(big, big), float("inf"))
+        self.assertEqual(mac_compute_batch([big], big), [float("inf")])
+
+    def test_mode2_large_product(self):
+        data = {
+            "filters": {"size_1": {"cross": [[10 ** 200]], "x": [[1]]}},
+            "patterns": {"size_1_1": {"input": [[10 ** 200]], "expected": "+"}},
+        }
+        with tempfile.TemporaryDirectory() as work_dir:
+            path = os.path.join(work_dir, "big.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                mode2_json_analysis(path)
+        self.assertIn("Cross 점수: inf", output.getvalue())
+        self.assertIn("통과:     1개", output.getvalue())
+
+
+class ShapeFastPathTest(unittest.TestCase):
+    def test_closed_form_matches_dense(self):
+        for n in range(1, 16):
+            for shape_a in SHAPES:
+                for shape_b in SHAPES:
+                    a = generate_shape_pattern(shape_a, n)
+                    b = generate_shape_pattern(shape_b, n)
+                    self.assertEqual(mac_compute(a, b), mac_compute_dense(a, b), (shape_a, shape_b, n))
+
+    def test_shared_pattern_keeps_no_buffer(self):
+        pattern = generate_cross_pattern(5)
+        values = pattern.values
+        values[0] = 99
+        # 반환된 버퍼를 고쳐도 캐시로 공유되는 패턴은 그대로
+        self.assertEqual(pattern.values[0], 0.0)
+        self.assertIsNot(pattern.values, pattern.values)
+        self.assertEqual(mac_compute_dense(pattern, pattern), mac_compute(pattern, pattern))
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            performance_analysis([5, 13])
+        repr(pattern)
+        self.assertIsNone(pattern._values)
+        self.assertIsNone(generate_cross_pattern(13)._values)
+
+    def test_get_value_matches_buffer(self):
+        for n in range(1, 10):
+            for shape in SHAPES:
+                pattern = generate_shape_pattern(shape, n)
+                values = pattern.values
+                for row in range(n):
+                    for col in range(n):
+                        self.assertEqual(pattern.get_value(row, col), values[row * n + col])
+
+    def test_empty_size(self):
+        self.assertEqual(shape_overlap("Cross", "Cross", 0), 0.0)
+        self.assertEqual(shape_overlap("Cross", "X", 0), 0.0)
+        with self.assertRaises(ValueError):
+            generate_cross_pattern(0)
+
+    def test_size_mismatch_raises(self):
+        cases = [
+            (generate_cross_pattern(5), generate_cross_pattern(7)),  # O(1)
+            (Pattern(5), generate_x_pattern(7)),                     # O(nnz)
+            (generate_x_pattern(5), Pattern(7)),                     # O(nnz)
+            (Pattern(5), Pattern(7)),                                # O(N²)
+        ]
+        for pattern, filter_p in cases:
+            with self.assertRaises(ValueError):
+                mac_compute(pattern, filter_p)
+        with self.assertRaises(ValueError):
+            mac_compute_batch([Pattern(5)], generate_cross_pattern(7))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+test_server.py - 채점 서버(server.py)의 마이크로 배치·통계·오류 처리 테스트
+
+    python -m unittest discover tests
+"""
+
+import json
+import os
+import sys
+import threading
+import unittest
+import urllib.error
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from main import Pattern, generate_cross_pattern, generate_x_pattern  # noqa: E402
+from server import ScoringError, ScoringServer  # noqa: E402
+
+CROSS_3 = [[0, 1, 0], [1, 1, 1], [0, 1, 0]]
+X_3 = [[1, 0, 1], [0, 1, 0], [1, 0, 1]]
+CROSS_5 = [[0, 0, 1, 0, 0], [0, 0, 1, 0, 0], [1, 1, 1, 1, 1], [0, 0, 1, 0, 0], [0, 0, 1, 0, 0]]
+
+
+def make_filters():
+    """size_3·size_5는 정상 필터, size_4는 크기가 맞지 않는(연산 중 실패하는) 필터"""
+    return {
+        "size_3": {"Cross": Pattern.from_2d_list(CROSS_3), "X": Pattern.from_2d_list(X_3)},
+        "size_5": {"Cross": generate_cross_pattern(5), "X": generate_x_pattern(5)},
+        "size_4": {"Cross": Pattern.from_2d_list(CROSS_5), "X": Pattern.from_2d_list(CROSS_5)},
+    }
+
+
+class ScoringServerTest(unittest.TestCase):
+    def start_server(self, **options):
+        server = ScoringServer(("127.0.0.1", 0), make_filters(), **options)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server
+
+    def request(self, server, method, path, body=None):
+        url = f"http://127.0.0.1:{server.server_address[1]}{path}"
+        data = None if body is None else json.dumps(body).encode("utf-8")
+        req = urllib.request.Request(url, data=data, method=method)
+        try:
+            with urllib.request.urlopen(req, timeout=10) as response:
+                return response.status, json.loads(response.read().decode("utf-8"))
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read().decode("utf-8"))
+
+    def test_mixed_sizes_in_one_batch(self):
+        # 창(window)을 넉넉히 두면 한 요청의 패턴이 크기가 달라도 한 배치로 묶인다
+        server = self.start_server(window_ms=200)
+        status, body = self.request(server, "POST", "/score",
+                                    {"patterns": [CROSS_3, CROSS_5, X_3, CROSS_5]})
+        self.assertEqual(status, 200)
+        results = body["results"]
+        self.assertEqual([r["size"] for r in results], ["size_3", "size_5", "size_3", "size_5"])
+        self.assertEqual([r["verdict"] for r in results], ["Cross", "Cross", "X", "Cross"])
+        self.assertEqual((results[1]["cross"], results[1]["x"]), (9.0, 1.0))
+
+        status, stats = self.request(server, "GET", "/stats")
+        self.assertEqual(status, 200)
+        self.assertEqual(stats["requests"], 1)
+        self.assertEqual(stats["patterns"], 4)
+        self.assertEqual(stats["scored"], 4)
+        self.assertEqual(stats["batches"], 1)
+        self.assertEqual(stats["max_batch_size"], 4)
+        self.assertEqual(stats["errors"], 0)
+
+    def test_failed_group_does_not_stop_worker(self):
+        server = self.start_server(window_ms=50)
+        four = [[0] * 4 for _ in range(4)]
+        status, body = self.request(server, "POST", "/score",
+                                    {"patterns": [four, CROSS_3, [[1, "a"], [0, 0]], [[1]]]})
+        self.assertEqual(status, 200)
+        results = body["results"]
+        self.assertIn("채점 실패", results[0]["error"])    # size_4 필터 연산 실패
+        self.assertEqual(results[1]["verdict"], "Cross")    # 같은 배치의 다른 크기는 정상
+        self.assertIn("패턴 데이터 오류", results[2]["error"])
+        self.assertIn("필터 없음", results[3]["error"])  # size_1 필터 없음
+
+        # 작업 스레드가 살아 있어 다음 요청도 처리된다
+        status, body = self.request(server, "POST", "/score", {"pattern": X_3})
+        self.assertEqual(status, 200)
+        self.assertEqual(body["results"][0]["verdict"], "X")
+        self.assertTrue(server.batcher.worker.is_alive())
+
+        status, stats = self.request(server, "GET", "/stats")
+        self.assertEqual(stats["errors"], 3)
+
+    def test_bad_pattern_does_not_fail_its_batch_neighbours(self):
+        # 검증을 거치지 않은 패턴(문자열 칸)을 다른 요청과 같은 배치에 넣는다
+        server = self.start_server(window_ms=200)
+        batcher = server.batcher
+        bad = Pattern(3, values=[0, 1, 0, 1, "a", 1, 0, 1, 0])
+        futures = [batcher.submit(Pattern.from_2d_list(CROSS_3)), batcher.submit(bad),
+                   batcher.submit(Pattern.from_2d_list(X_3))]
+
+        self.assertEqual(futures[0].result(timeout=5)["verdict"], "Cross")
+        with self.assertRaises(ScoringError):
+            futures[1].result(timeout=5)
+        self.assertEqual(futures[2].result(timeout=5)["verdict"], "X")
+
+        stats = server.stats.snapshot()
+        self.assertEqual(stats["batches"], 1)
+        self.assertEqual(stats["scored"], 2)
+
+    def test_timeout_returns_504(self):
+        server = self.start_server(window_ms=1000, request_timeout=0.05)
+        status, body = self.request(server, "POST", "/score", {"pattern": CROSS_3})
+        self.assertEqual(status, 504)
+        self.assertIn("시간 초과", body["error"])
+        status, stats = self.request(server, "GET", "/stats")
+        self.assertEqual(stats["errors"], 1)
+
+    def test_bad_request(self):
+        server = self.start_server()
+        self.assertEqual(self.request(server, "POST", "/score", {"foo": 1})[0], 400)
+        self.assertEqual(self.request(server, "GET", "/nope")[0], 404)
+
+
+if __name__ == "__main__":
+    unittest.main()